@@ -4,8 +4,17 @@ This module provides wrapper functions for executing git commands via subprocess
 All git operations are isolated here for easier testing and maintenance.
 """
 
+import asyncio
+import atexit
+import functools
+import os
+import re
+import shutil
 import subprocess
+import threading
 import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from .exceptions import (
@@ -16,27 +25,160 @@ from .exceptions import (
     PushError,
     RepositoryNotFoundError,
 )
-from .models import BranchInfo, GitOperationResult, Project, PushAction, PushResult, PushStatus
+from .models import (
+    BranchInfo,
+    GitCommandSpec,
+    GitOperationResult,
+    Project,
+    PushAction,
+    PushItem,
+    PushResult,
+    PushStatus,
+)
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
 
 __all__ = [
     "GitOperationResult",
     "run_git_command",
+    "run_git_command_async",
+    "run_git_commands_parallel",
+    "gather_git_commands",
     "git_subtree_add",
     "git_subtree_pull",
     "git_subtree_push",
     "git_subtree_split",
+    "git_subtree_split_many",
     "git_fetch",
     "detect_current_branch",
     "detect_default_branch",
     "create_branch_info",
     "determine_target_branch",
     "execute_git_push",
+    "execute_git_push_batch",
+    "AsyncPushExecutor",
 ]
 
+# Absolute path to git, resolved once and used for every git process so exec
+# never searches $PATH. Combined with passing the working directory as "git -C"
+# instead of cwd=, this lets subprocess start git with posix_spawn rather than
+# its slower fork + exec path.
+_GIT_EXECUTABLE = shutil.which("git") or "git"
+
+# Fixed argument lists, built once instead of on every call
+_GIT_VERSION_ARGS = ("--version",)
+_GIT_VERSION_PREFIX = "git version "
+_GIT_INIT_ARGS = ("init",)
+_GIT_STATUS_ARGS = ("status",)
+_GIT_STATUS_SHORT_ARGS = ("status", "--short")
+_SUBTREE_ADD_ARGS = ("subtree", "add")
+# Trailing flags indexed by the squash bool
+_SQUASH_ARGS: tuple[tuple[str, ...], tuple[str, ...]] = ((), ("--squash",))
+
+# Config for the git processes behind a push (exported to the ones subtree push runs).
+# Reachability bitmaps make pack-objects slow for the small incremental packs a
+# push sends, and the ambiguous-ref warning costs a ref lookup per name resolved.
+_PUSH_CONFIG_ARGS = ("-c", "pack.useBitmaps=false", "-c", "core.warnAmbiguousRefs=false")
+_BATCH_PUSH_ARGS = ("push", "--porcelain", "--thin", "--no-atomic")
+_SUBTREE_PUSH_COMMAND = (_GIT_EXECUTABLE, *_PUSH_CONFIG_ARGS, "subtree", "push")
+# Force flag indexed by the force bool
+_FORCE_ARGS: tuple[tuple[str, ...], tuple[str, ...]] = ((), ("--force",))
+
+# Read-only ref lookups skip optional locks so concurrent invocations don't contend
+_SYMBOLIC_REF_COMMAND = (
+    _GIT_EXECUTABLE,
+    "--no-optional-locks",
+    "symbolic-ref",
+    "--short",
+)
+
+
+def _git_env() -> dict[str, str]:
+    """Build the environment for git processes.
+
+    Optional lock writes (e.g. the index refresh done by git status) are skipped
+    and messages are forced to the C locale so stderr can be matched reliably.
+    Credential prompts are disabled unless GIT_TERMINAL_PROMPT is already set,
+    so a fetch needing credentials fails instead of hanging.
+
+    Returns:
+        Environment mapping for subprocess
+    """
+    return {
+        "GIT_TERMINAL_PROMPT": "0",
+        **os.environ,
+        "GIT_OPTIONAL_LOCKS": "0",
+        "LC_ALL": "C",
+    }
+
+
+def _spawn_argv(args: Sequence[str], cwd: str | None) -> list[str]:
+    """Build the argv used to start git, selecting the directory with -C.
+
+    Args:
+        args: Git command arguments
+        cwd: Working directory for command execution, already converted with os.fspath
+
+    Returns:
+        Full argv starting with the git executable
+    """
+    if cwd is None:
+        return [_GIT_EXECUTABLE, *args]
+    return [_GIT_EXECUTABLE, "-C", cwd, *args]
+
+
+def _complete_git_result(
+    command: list[str],
+    returncode: int,
+    stdout: str,
+    stderr: str,
+    duration: float,
+    check: bool,
+) -> GitOperationResult:
+    """Build the result of a finished git process, raising if required.
+
+    Args:
+        command: The full git command line
+        returncode: Process exit code
+        stdout: Decoded standard output
+        stderr: Decoded standard error
+        duration: Execution time in seconds
+        check: Whether to raise exception on failure
+
+    Returns:
+        GitOperationResult with command output and status
+
+    Raises:
+        GitCommandError: If check=True and command failed
+    """
+    success = returncode == 0
+
+    git_result = GitOperationResult(
+        success=success,
+        stdout=stdout,
+        stderr=stderr,
+        exit_code=returncode,
+        duration=duration,
+        command=command,
+    )
+
+    if check and not success:
+        raise GitCommandError(
+            f"Git command failed: {' '.join(command)}",
+            command,
+            returncode,
+            stderr,
+        )
+
+    return git_result
+
 
 def run_git_command(
-    args: list[str],
-    cwd: Path | None = None,
+    args: Sequence[str],
+    cwd: str | os.PathLike[str] | None = None,
     check: bool = True,
     timeout: int = 300,
 ) -> GitOperationResult:
@@ -55,42 +197,79 @@ def run_git_command(
         GitCommandError: If check=True and command fails
     """
     command = ["git", *args]
+    # Convert the path once; everything below works with the string
+    cwd_str = os.fspath(cwd) if cwd is not None else None
+
     start_time = time.time()
 
     try:
+        # Capture raw bytes and decode once below; text mode would add a
+        # newline-translation pass over output git already terminates with "\n"
         result = subprocess.run(
-            command,
-            cwd=cwd,
+            _spawn_argv(args, cwd_str),
             capture_output=True,
-            text=True,
+            env=_git_env(),
             timeout=timeout,
             check=False,  # We handle errors ourselves
         )
+    except subprocess.TimeoutExpired as e:
+        raise GitCommandError(
+            f"Git command timed out after {timeout}s: {' '.join(command)}",
+            command,
+            -1,
+            str(e),
+        ) from e
 
-        duration = time.time() - start_time
-        success = result.returncode == 0
+    return _complete_git_result(
+        command,
+        result.returncode,
+        result.stdout.decode(),
+        result.stderr.decode(),
+        time.time() - start_time,
+        check,
+    )
 
-        git_result = GitOperationResult(
-            success=success,
-            stdout=result.stdout,
-            stderr=result.stderr,
-            exit_code=result.returncode,
-            duration=duration,
-            command=command,
-        )
 
-        if check and not success:
-            raise GitCommandError(
-                f"Git command failed: {' '.join(command)}",
-                command,
-                result.returncode,
-                result.stderr,
-            )
+async def run_git_command_async(
+    args: Sequence[str],
+    cwd: str | os.PathLike[str] | None = None,
+    check: bool = True,
+    timeout: int = 300,
+) -> GitOperationResult:
+    """Execute a git command without blocking the event loop.
 
-        return git_result
+    Lets callers issue many fetches/pulls with asyncio.gather() without tying up
+    a thread per command.
 
-    except subprocess.TimeoutExpired as e:
-        duration = time.time() - start_time
+    Args:
+        args: Git command arguments (e.g., ["status", "--short"])
+        cwd: Working directory for command execution
+        check: Whether to raise exception on failure
+        timeout: Command timeout in seconds
+
+    Returns:
+        GitOperationResult with command output and status
+
+    Raises:
+        GitCommandError: If check=True and command fails, or the command times out
+    """
+    command = ["git", *args]
+    # Convert the path once; everything below works with the string
+    cwd_str = os.fspath(cwd) if cwd is not None else None
+
+    start_time = time.time()
+
+    proc = await asyncio.create_subprocess_exec(
+        *_spawn_argv(args, cwd_str),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=_git_env(),
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except TimeoutError as e:
+        proc.kill()
+        await proc.wait()
         raise GitCommandError(
             f"Git command timed out after {timeout}s: {' '.join(command)}",
             command,
@@ -98,22 +277,125 @@ def run_git_command(
             str(e),
         ) from e
 
+    return _complete_git_result(
+        command,
+        proc.returncode if proc.returncode is not None else -1,
+        stdout.decode(),
+        stderr.decode(),
+        time.time() - start_time,
+        check,
+    )
+
+
+def _usable_cpu_count() -> int:
+    """Count the CPUs this process may run on.
+
+    Honors CPU affinity (e.g. taskset or container cpusets) where the platform
+    exposes it, rather than the total number of CPUs in the machine.
+
+    Returns:
+        Number of usable CPUs
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 4
+
+
+def run_git_commands_parallel(
+    specs: list[GitCommandSpec],
+    max_workers: int | None = None,
+) -> list[GitOperationResult]:
+    """Execute independent git commands concurrently.
+
+    Each command is a separate git process that spends its time in fork/exec,
+    disk and network I/O, so a thread pool overlaps them without GIL contention.
+    Every command runs with its own cwd; the process working directory is never
+    changed.
+
+    Args:
+        specs: Commands to execute
+        max_workers: Thread pool size (default: 3/4 of the usable CPUs, at least 2)
+
+    Returns:
+        Results in the same order as specs
+
+    Raises:
+        GitCommandError: If a command with check=True fails (first failure in spec order)
+    """
+    if max_workers is None:
+        max_workers = max(2, _usable_cpu_count() * 3 // 4)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                run_git_command,
+                spec.args,
+                cwd=spec.cwd,
+                check=spec.check,
+                timeout=spec.timeout,
+            )
+            for spec in specs
+        ]
+        return [future.result() for future in futures]
+
+
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Select the event loop used to drive concurrent git processes.
+
+    uvloop (libuv) reaps child processes and drains their pipes with fewer Python-level
+    callbacks than the default epoll loop, so it is preferred when installed.
+
+    Returns:
+        Loop factory for asyncio.run, or None for the default loop
+    """
+    return uvloop.new_event_loop if uvloop is not None else None
+
+
+def gather_git_commands(specs: list[GitCommandSpec]) -> list[GitOperationResult]:
+    """Execute independent git commands concurrently on a single event loop.
+
+    Unlike run_git_commands_parallel, no thread is tied up per command: all
+    processes are awaited from one loop.
+
+    Args:
+        specs: Commands to execute
+
+    Returns:
+        Results in the same order as specs
+
+    Raises:
+        GitCommandError: If a command with check=True fails
+    """
+
+    async def _gather() -> list[GitOperationResult]:
+        return await asyncio.gather(
+            *(
+                run_git_command_async(
+                    spec.args, cwd=spec.cwd, check=spec.check, timeout=spec.timeout
+                )
+                for spec in specs
+            )
+        )
+
+    return asyncio.run(_gather(), loop_factory=_event_loop_factory())
+
 
+@functools.lru_cache(maxsize=1)
 def git_version() -> str:
     """Get git version string.
 
+    The result is cached for the lifetime of the process; call
+    git_version.cache_clear() to force a new lookup.
+
     Returns:
         Git version (e.g., "2.43.0")
 
     Raises:
         GitCommandError: If git is not available
     """
-    result = run_git_command(["--version"])
+    result = run_git_command(list(_GIT_VERSION_ARGS))
     # Output format: "git version 2.43.0"
-    version_str = result.stdout.strip()
-    if version_str.startswith("git version "):
-        return version_str[len("git version ") :]
-    return version_str
+    return result.stdout.strip().removeprefix(_GIT_VERSION_PREFIX)
 
 
 def git_init(path: Path) -> GitOperationResult:
@@ -128,7 +410,7 @@ def git_init(path: Path) -> GitOperationResult:
     Raises:
         GitCommandError: If initialization fails
     """
-    return run_git_command(["init"], cwd=path)
+    return run_git_command(list(_GIT_INIT_ARGS), cwd=path)
 
 
 def git_add(path: Path, files: list[str]) -> GitOperationResult:
@@ -222,9 +504,7 @@ def git_subtree_add(
     Raises:
         GitCommandError: If subtree add fails
     """
-    args = ["subtree", "add", f"--prefix={prefix}", repository, ref]
-    if squash:
-        args.append("--squash")
+    args = [*_SUBTREE_ADD_ARGS, f"--prefix={prefix}", repository, ref, *_SQUASH_ARGS[squash]]
     return run_git_command(args, cwd=path, timeout=600)  # Longer timeout for subtree ops
 
 
@@ -298,10 +578,50 @@ def git_subtree_split(
     Raises:
         GitCommandError: If subtree split fails
     """
+    return run_git_command(_subtree_split_args(prefix, branch), cwd=path, timeout=600)
+
+
+def git_subtree_split_many(
+    path: Path,
+    splits: list[tuple[str, str | None]],
+) -> dict[str, GitOperationResult]:
+    """Split out several subtrees concurrently.
+
+    Each split is a separate CPU-bound git process, so they are spread across
+    the usable CPUs via run_git_commands_parallel.
+
+    Args:
+        path: Repository directory
+        splits: (prefix, branch) pairs; branch may be None
+
+    Returns:
+        Mapping of prefix to its split result
+
+    Raises:
+        GitCommandError: If any subtree split fails
+    """
+    specs = [
+        GitCommandSpec(_subtree_split_args(prefix, branch), cwd=path, timeout=600)
+        for prefix, branch in splits
+    ]
+    results = run_git_commands_parallel(specs)
+    return {prefix: result for (prefix, _), result in zip(splits, results, strict=True)}
+
+
+def _subtree_split_args(prefix: str, branch: str | None) -> list[str]:
+    """Build the arguments for git subtree split.
+
+    Args:
+        prefix: Subtree prefix path
+        branch: Optional branch name to create
+
+    Returns:
+        Git command arguments
+    """
     args = ["subtree", "split", f"--prefix={prefix}"]
     if branch:
         args.extend(["--branch", branch])
-    return run_git_command(args, cwd=path, timeout=600)
+    return args
 
 
 def git_status(path: Path, short: bool = False) -> GitOperationResult:
@@ -317,15 +637,175 @@ def git_status(path: Path, short: bool = False) -> GitOperationResult:
     Raises:
         GitCommandError: If status check fails
     """
-    args = ["status"]
-    if short:
-        args.append("--short")
-    return run_git_command(args, cwd=path)
+    return run_git_command(list(_GIT_STATUS_SHORT_ARGS if short else _GIT_STATUS_ARGS), cwd=path)
+
+
+class _GitSession:
+    """Long-lived ``git cat-file --batch-command`` process for resolving object names.
+
+    Resolving many refs in the same repository through one process avoids paying
+    fork/exec and git startup for every lookup.
+    """
+
+    def __init__(self, cwd: str) -> None:
+        """Start the batch process.
+
+        Args:
+            cwd: Repository directory, already converted with os.fspath
+
+        Raises:
+            OSError: If git cannot be started
+        """
+        self.proc = subprocess.Popen(
+            _spawn_argv(_CAT_FILE_BATCH_ARGS, cwd),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=_git_env(),
+            bufsize=0,
+        )
+        assert self.proc.stdin is not None
+        assert self.proc.stdout is not None
+        # Talk to the pipes through their descriptors; the raw file objects read
+        # lines one byte per system call
+        self._in_fd = self.proc.stdin.fileno()
+        self._out_fd = self.proc.stdout.fileno()
+        self._pending = bytearray()
+        self._lock = threading.Lock()
+
+    def resolve(self, ref: str) -> str | None:
+        """Resolve a ref to an object SHA.
+
+        Args:
+            ref: Reference (branch, tag, HEAD, etc.)
+
+        Returns:
+            Object SHA, or None if the ref cannot be resolved. Refs containing
+            whitespace are never sent: the batch protocol is line-based, and a
+            newline would desynchronize every later lookup.
+
+        Raises:
+            BrokenPipeError: If the batch process has exited
+        """
+        if not ref or _WHITESPACE.search(ref):
+            return None
+        payload = memoryview(f"info {ref}\n".encode())
+        with self._lock:
+            while payload:
+                payload = payload[os.write(self._in_fd, payload) :]
+            line = self._read_line()
+
+        # "<sha> <type> <size>" on success, "<ref> missing" / "<ref> ambiguous" otherwise
+        fields = line.split()
+        if len(fields) != 3 or not fields[2].isdigit():
+            return None
+        return fields[0]
+
+    def _read_line(self) -> str:
+        """Read one response line, buffering any bytes that follow it.
+
+        Returns:
+            The line without its newline
+
+        Raises:
+            BrokenPipeError: If the batch process has exited
+        """
+        pending = self._pending
+        end = pending.find(b"\n")
+        while end < 0:
+            chunk = os.read(self._out_fd, 4096)
+            if not chunk:
+                raise BrokenPipeError("git cat-file --batch-command exited")
+            pending += chunk
+            end = pending.find(b"\n", len(pending) - len(chunk))
+        line = pending[:end].decode()
+        del pending[: end + 1]
+        return line
+
+    def close(self) -> None:
+        """Terminate the batch process."""
+        if self.proc.stdin is not None:
+            self.proc.stdin.close()
+        self.proc.wait()
+
+
+_CAT_FILE_BATCH_ARGS = ("cat-file", "--batch-command")
+_WHITESPACE = re.compile(r"\s")
+
+_GIT_SESSIONS: dict[str, _GitSession] = {}
+# Directories where a session could not be used (e.g. not a repository); their
+# lookups go straight to rev-parse instead of starting a new failing process each time
+_GIT_SESSIONS_FAILED: set[str] = set()
+_GIT_SESSIONS_LOCK = threading.Lock()
+
+# Cleared when git rejects --batch-command (git < 2.36) so lookups use rev-parse
+_BATCH_COMMAND_SUPPORTED = True
+
+# Exit status git uses for unknown options
+_GIT_USAGE_ERROR = 129
+
+
+def close_git_sessions() -> None:
+    """Terminate all persistent git sessions and forget directories where they failed."""
+    with _GIT_SESSIONS_LOCK:
+        sessions = list(_GIT_SESSIONS.values())
+        _GIT_SESSIONS.clear()
+        _GIT_SESSIONS_FAILED.clear()
+    for session in sessions:
+        session.close()
+
+
+def _git_session(key: str) -> _GitSession | None:
+    """Get or start the batch session for a directory.
+
+    Args:
+        key: Repository directory, already converted with os.fspath
+
+    Returns:
+        The session, or None if sessions failed in this directory before
+
+    Raises:
+        OSError: If git cannot be started
+    """
+    with _GIT_SESSIONS_LOCK:
+        if key in _GIT_SESSIONS_FAILED:
+            return None
+        session = _GIT_SESSIONS.get(key)
+        if session is None:
+            session = _GIT_SESSIONS[key] = _GitSession(key)
+        return session
+
+
+def _drop_git_session(key: str, session: _GitSession | None) -> None:
+    """Discard a session that stopped working and remember the directory.
+
+    Args:
+        key: Repository directory, already converted with os.fspath
+        session: The failed session, if one was started
+    """
+    global _BATCH_COMMAND_SUPPORTED
+
+    with _GIT_SESSIONS_LOCK:
+        if _GIT_SESSIONS.get(key) is session:
+            _GIT_SESSIONS.pop(key, None)
+        _GIT_SESSIONS_FAILED.add(key)
+    if session is not None:
+        session.close()
+        if session.proc.returncode == _GIT_USAGE_ERROR:
+            # git predates --batch-command
+            _BATCH_COMMAND_SUPPORTED = False
+
+
+atexit.register(close_git_sessions)
 
 
 def git_rev_parse(path: Path, ref: str) -> str:
     """Get commit SHA for a ref.
 
+    Lookups go through a persistent per-repository ``git cat-file --batch-command``
+    process. Refs it cannot resolve are retried with ``git rev-parse`` so errors are
+    reported the same way as before.
+
     Args:
         path: Repository directory
         ref: Reference (branch, tag, HEAD, etc.)
@@ -336,8 +816,71 @@ def git_rev_parse(path: Path, ref: str) -> str:
     Raises:
         GitCommandError: If rev-parse fails
     """
+    if _BATCH_COMMAND_SUPPORTED:
+        # Sessions outlive the caller's working directory, so key them by absolute path
+        key = os.fspath(path.resolve())
+        session = None
+        try:
+            session = _git_session(key)
+            sha = session.resolve(ref) if session is not None else None
+        except OSError:
+            _drop_git_session(key, session)
+        else:
+            if sha is not None:
+                return sha
+
     result = run_git_command(["rev-parse", ref], cwd=path)
-    return result.stdout.strip()
+    stdout = result.stdout
+    # rev-parse prints exactly "<sha>\n"; drop the newline without scanning
+    return stdout[:-1] if stdout.endswith("\n") else stdout.strip()
+
+
+def git_rev_parse_many(path: Path, refs: Sequence[str]) -> dict[str, str]:
+    """Get commit SHAs for several refs with a single git process.
+
+    Args:
+        path: Repository directory
+        refs: References (branches, tags, HEAD, etc.)
+
+    Returns:
+        Dictionary mapping each ref to its commit SHA
+
+    Raises:
+        ValueError: If an argument is an option or a range rather than a ref
+        GitCommandError: If any ref cannot be resolved
+    """
+    if not refs:
+        return {}
+    for ref in refs:
+        if not _is_single_ref(ref):
+            raise ValueError(f"Not a single ref: {ref!r}")
+    result = run_git_command(["rev-parse", *refs], cwd=path)
+    shas = result.stdout.splitlines()
+    if len(shas) != len(refs):
+        raise GitCommandError(
+            f"git rev-parse printed {len(shas)} lines for {len(refs)} refs",
+            command=result.command,
+            exit_code=result.exit_code,
+            stderr=result.stderr,
+        )
+    return dict(zip(refs, shas, strict=True))
+
+
+def _is_single_ref(ref: str) -> bool:
+    """Check that rev-parse will print exactly one line for ref.
+
+    Options (``--all``), ranges (``A..B``, ``A...B``) and the ``^!``,
+    ``^@`` and ``^-`` shorthands expand to zero or several revisions.
+
+    Args:
+        ref: Reference as passed on the command line
+
+    Returns:
+        True if ref names a single revision
+    """
+    if not ref or ref.startswith("-") or ".." in ref or _WHITESPACE.search(ref):
+        return False
+    return not ref.endswith(("^!", "^@")) and "^-" not in ref
 
 
 def git_push(
@@ -388,11 +931,7 @@ def git_log(
     Raises:
         GitCommandError: If log fails
     """
-    args = ["log"]
-    if oneline:
-        args.append("--oneline")
-    if limit:
-        args.extend(["-n", str(limit)])
+    args = [*_log_options(oneline, limit or None)]
     if revision_range:
         args.append(revision_range)
     if paths:
@@ -401,6 +940,23 @@ def git_log(
     return run_git_command(args, cwd=path)
 
 
+@functools.lru_cache(maxsize=32)
+def _log_options(oneline: bool, limit: int | None) -> tuple[str, ...]:
+    """Build the leading git log arguments for a combination of options.
+
+    Args:
+        oneline: Whether to use oneline format
+        limit: Maximum number of commits to show
+
+    Returns:
+        Arguments up to (excluding) the revision range and paths
+    """
+    options: tuple[str, ...] = ("log", "--oneline") if oneline else ("log",)
+    if limit:
+        options += ("-n", str(limit))
+    return options
+
+
 def git_rev_list(
     path: Path,
     revision_range: str,
@@ -439,7 +995,7 @@ def detect_current_branch(cwd: Path | None = None) -> str:
         GitCommandError: If git command fails for other reasons
     """
     result = subprocess.run(
-        ["git", "symbolic-ref", "--short", "HEAD"],
+        [*_SYMBOLIC_REF_COMMAND, "HEAD"],
         capture_output=True,
         text=True,
         check=False,
@@ -464,9 +1020,12 @@ def detect_default_branch(cwd: Path | None = None) -> str:
     Returns:
         Default branch name (e.g., "main", "master", "develop")
     """
+    # A missing origin/HEAD is the common case and its stderr is never used,
+    # so discard it instead of capturing it
     result = subprocess.run(
-        ["git", "symbolic-ref", "--short", "refs/remotes/origin/HEAD"],
-        capture_output=True,
+        [*_SYMBOLIC_REF_COMMAND, "refs/remotes/origin/HEAD"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
         check=False,
         cwd=cwd,
@@ -477,11 +1036,7 @@ def detect_default_branch(cwd: Path | None = None) -> str:
         return "main"
 
     # Output format: "origin/branch-name" -> extract "branch-name"
-    branch_with_remote = result.stdout.strip()
-    if branch_with_remote.startswith("origin/"):
-        return branch_with_remote[len("origin/") :]
-
-    return branch_with_remote
+    return result.stdout.strip().removeprefix("origin/")
 
 
 def create_branch_info(cwd: Path | None = None) -> BranchInfo:
@@ -532,11 +1087,12 @@ def determine_target_branch(branch_info: BranchInfo, project: Project) -> str:
 
 def execute_git_push(
     component_name: str,
-    component_path: Path,
+    component_path: str | os.PathLike[str],
     remote_url: str,
     branch_name: str,
     force: bool = False,
     cwd: Path | None = None,
+    runner: Callable[..., subprocess.CompletedProcess[bytes]] | None = None,
 ) -> PushResult:
     """Execute git subtree push to remote repository.
 
@@ -547,6 +1103,8 @@ def execute_git_push(
         branch_name: Branch name to push to
         force: Whether to force push
         cwd: Working directory for git command (default: current directory)
+        runner: Callable with subprocess.run's signature used to execute the push
+            (default: subprocess.run)
 
     Returns:
         PushResult with status and action taken
@@ -558,31 +1116,35 @@ def execute_git_push(
         PushError: For other push failures
     """
     # Build git subtree push command
-    cmd = ["git", "subtree", "push", f"--prefix={component_path}", remote_url, branch_name]
-    if force:
-        cmd.insert(3, "--force")  # Insert after "push"
+    cmd = (
+        _SUBTREE_PUSH_COMMAND
+        + _FORCE_ARGS[force]
+        + (f"--prefix={os.fspath(component_path)}", remote_url, branch_name)
+    )
 
     # Execute push
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False, cwd=cwd, timeout=600)
+    if runner is None:
+        runner = subprocess.run
+    # Output stays bytes: a successful push only needs one substring test, so
+    # stderr is decoded only when a failure has to be classified and reported.
+    # Descriptors Python opens are non-inheritable already (PEP 446), so the
+    # child needs no close-every-fd sweep; only the pipes set up here survive.
+    result = runner(
+        cmd,
+        capture_output=True,
+        check=False,
+        cwd=cwd,
+        env=_git_env(),
+        timeout=600,
+        close_fds=False,
+    )
 
     if result.returncode != 0:
-        stderr_lower = result.stderr.lower()
-
-        # Check for specific error conditions
-        if "protected branch" in stderr_lower or "permission denied" in stderr_lower:
-            raise BranchProtectionError(branch=branch_name, component=component_name)
-
-        if "repository" in stderr_lower and "not found" in stderr_lower:
-            raise RepositoryNotFoundError(repository=remote_url)
-
-        if "non-fast-forward" in stderr_lower or "[rejected]" in result.stderr:
-            raise NonFastForwardError(branch=branch_name, component=component_name)
-
-        # Generic push error
-        raise PushError(f"Push failed for {component_name}: {result.stderr}")
+        stderr = result.stderr.decode(errors="replace")
+        raise _push_error(stderr, component_name, branch_name, remote_url)
 
     # Determine action based on output
-    action = PushAction.CREATED if "[new branch]" in result.stderr else PushAction.UPDATED
+    action = PushAction.CREATED if b"[new branch]" in result.stderr else PushAction.UPDATED
 
     return PushResult(
         project_name=component_name,
@@ -591,3 +1153,265 @@ def execute_git_push(
         branch_name=branch_name,
         error_message=None,
     )
+
+
+# Failure indicators in git push output, matched in a single pass
+_PUSH_FAILURE_RE = re.compile(
+    r"(?P<protected>protected branch|permission denied)"
+    r"|(?P<repository>repository)"
+    r"|(?P<not_found>not found)"
+    r"|(?P<non_fast_forward>non-fast-forward|\[rejected\])",
+    re.IGNORECASE,
+)
+
+
+def _push_error(
+    stderr: str,
+    component_name: str,
+    branch_name: str,
+    remote_url: str,
+) -> PushError:
+    """Classify a failed push from git's error output.
+
+    Args:
+        stderr: Error output (or per-ref summary) reported by git
+        component_name: Name of the component (for error messages)
+        branch_name: Branch name that was pushed to
+        remote_url: Remote repository URL
+
+    Returns:
+        The most specific PushError for the failure
+    """
+    # One scan collects every indicator present; the checks below apply precedence
+    found = {match.lastgroup for match in _PUSH_FAILURE_RE.finditer(stderr)}
+
+    # Check for specific error conditions
+    if "protected" in found:
+        return BranchProtectionError(branch=branch_name, component=component_name)
+
+    if "repository" in found and "not_found" in found:
+        return RepositoryNotFoundError(repository=remote_url)
+
+    if "non_fast_forward" in found:
+        return NonFastForwardError(branch=branch_name, component=component_name)
+
+    # Generic push error
+    return PushError(f"Push failed for {component_name}: {stderr}")
+
+
+def execute_git_push_batch(
+    items: list[PushItem],
+    cwd: Path | None = None,
+    popen: Callable[..., subprocess.Popen[str]] | None = None,
+) -> list[PushResult]:
+    """Push several component subtrees with one git push per remote.
+
+    Each component is split locally first (concurrently), then all split commits
+    that share a remote are sent with a single ``git push --porcelain`` carrying one
+    refspec per component, so each remote costs one connection and one pack
+    negotiation. Failures are reported per component instead of raised.
+
+    This is library API: the push command pushes a single component through
+    SubtreeManager and does not call it.
+
+    Args:
+        items: Components to push
+        cwd: Working directory for git commands (default: current directory)
+        popen: Callable with subprocess.Popen's signature used to start the pushes
+            (default: subprocess.Popen)
+
+    Returns:
+        One PushResult per item, in the same order as items
+
+    Raises:
+        GitCommandError: If splitting a component subtree fails
+    """
+    if not items:
+        return []
+    if popen is None:
+        popen = subprocess.Popen
+
+    specs = [
+        GitCommandSpec(
+            _subtree_split_args(os.fspath(item.component_path), None), cwd=cwd, timeout=600
+        )
+        for item in items
+    ]
+    shas = [result.stdout.strip() for result in run_git_commands_parallel(specs)]
+
+    groups: dict[str, list[int]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(item.remote_url, []).append(index)
+
+    results: list[PushResult | None] = [None] * len(items)
+    for remote_url, indices in groups.items():
+        refspecs = [
+            f"{'+' if items[i].force else ''}{shas[i]}:refs/heads/{items[i].branch_name}"
+            for i in indices
+        ]
+        pending: dict[str, list[int]] = {}
+        for i in indices:
+            pending.setdefault(f"refs/heads/{items[i].branch_name}", []).append(i)
+        messages: list[str] = []
+
+        # Thin packs let the remote's existing objects serve as delta bases; without
+        # atomic all-or-nothing semantics one rejected ref doesn't fail the others.
+        # stderr is merged into the one pipe being read so it can't fill up and stall git.
+        with popen(
+            [_GIT_EXECUTABLE, *_PUSH_CONFIG_ARGS, *_BATCH_PUSH_ARGS, remote_url, *refspecs],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            cwd=cwd,
+            env=_git_env(),
+            close_fds=False,
+        ) as proc:
+            assert proc.stdout is not None
+            watchdog = threading.Timer(600, proc.kill)
+            watchdog.start()
+            try:
+                # Each ref is classified as soon as git reports it
+                for line in proc.stdout:
+                    status = _parse_porcelain_line(line)
+                    if status is None:
+                        if not line.startswith("To ") and line.rstrip("\n") != "Done":
+                            messages.append(line)
+                        continue
+                    flag, destination, summary = status
+                    for i in pending.pop(destination, ()):
+                        results[i] = _batch_push_result(items[i], flag, summary, "")
+            finally:
+                watchdog.cancel()
+
+        # Leaving the block waited for git; a ref without a status line has no
+        # confirmed success, and a non-zero exit says why when git printed nothing
+        if proc.returncode != 0:
+            messages.append(f"git push exited with status {proc.returncode}\n")
+
+        # Refs git never reported on failed with the push as a whole
+        output = "".join(messages)
+        for unreported in pending.values():
+            for i in unreported:
+                results[i] = _batch_push_result(items[i], "", "", output)
+
+    return [result for result in results if result is not None]
+
+
+def _parse_porcelain_line(line: str) -> tuple[str, str, str] | None:
+    """Parse one ref status line of ``git push --porcelain`` output.
+
+    Args:
+        line: Line of git push --porcelain output
+
+    Returns:
+        (flag, destination ref, summary), or None for lines that aren't ref statuses
+    """
+    # "<flag>\t<from>:<to>\t<summary>"; other lines are "To <url>", "Done" and errors
+    fields = line.rstrip("\n").split("\t")
+    if len(fields) < 3 or len(fields[0]) != 1:
+        return None
+    return fields[0], fields[1].rpartition(":")[2], fields[2]
+
+
+def _batch_push_result(item: PushItem, flag: str, summary: str, stderr: str) -> PushResult:
+    """Build the result for one component of a batched push.
+
+    Args:
+        item: Component that was pushed
+        flag: Porcelain status flag for its ref ("" if git reported none)
+        summary: Porcelain summary for its ref
+        stderr: Error output of the push command (used when git reported no status)
+
+    Returns:
+        PushResult for the component
+    """
+    # "=" (already up to date) counts as an update: the branch ends at the pushed commit
+    if flag in ("*", " ", "+", "="):
+        return PushResult(
+            project_name=item.component_name,
+            status=PushStatus.SUCCESS,
+            action=PushAction.CREATED if flag == "*" else PushAction.UPDATED,
+            branch_name=item.branch_name,
+            error_message=None,
+        )
+
+    # Rejected refs carry their reason in the summary; without a status line the
+    # whole push failed (e.g. unreachable remote) and only stderr explains why
+    error = _push_error(
+        summary or stderr.strip() or "no status reported",
+        item.component_name,
+        item.branch_name,
+        item.remote_url,
+    )
+    return PushResult(
+        project_name=item.component_name,
+        status=PushStatus.FAILED,
+        action=PushAction.SKIPPED,
+        branch_name=item.branch_name,
+        error_message=str(error),
+    )
+
+
+class AsyncPushExecutor:
+    """Run component pushes in the background.
+
+    Each push is a long-running git process, so a thread pool is enough to keep
+    the caller free while pushes drain; the GIL is released while waiting on git.
+    Like execute_git_push_batch, this is library API that the push command, which
+    pushes a single component, does not use.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        cwd: Path | None = None,
+        runner: Callable[..., subprocess.CompletedProcess[bytes]] | None = None,
+    ) -> None:
+        """Create the worker pool.
+
+        Args:
+            max_workers: Maximum concurrent pushes (default: usable CPUs, at most 8)
+            cwd: Working directory for git commands (default: current directory)
+            runner: Process runner passed through to execute_git_push
+        """
+        if max_workers is None:
+            max_workers = min(8, _usable_cpu_count())
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._cwd = cwd
+        self._runner = runner
+
+    def submit(self, item: PushItem) -> Future[PushResult]:
+        """Schedule a push.
+
+        Args:
+            item: Component to push
+
+        Returns:
+            Future resolving to the PushResult, or raising the push's PushError
+        """
+        return self._executor.submit(
+            execute_git_push,
+            component_name=item.component_name,
+            component_path=item.component_path,
+            remote_url=item.remote_url,
+            branch_name=item.branch_name,
+            force=item.force,
+            cwd=self._cwd,
+            runner=self._runner,
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting pushes.
+
+        Args:
+            wait: Whether to block until submitted pushes finish
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> AsyncPushExecutor:
+        """Enter the context, returning the executor."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Wait for submitted pushes and shut down."""
+        self.shutdown()
@@ -4,15 +4,39 @@ Provides functions to parse repo-style manifest XML files and convert them to
 typed data structures with validation.
 """
 
+import functools
+import io
 import re
+import sys
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import IO, Any
 
 from .exceptions import ManifestError, ManifestValidationError
+from .git_commands import _usable_cpu_count
 from .models import Copyfile, Linkfile, Manifest, Project, Remote
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - optional dependency
+    lxml_etree = None
+
+# Parse with libxml2 through lxml when it is installed; ElementTree otherwise
+_USE_LXML = lxml_etree is not None
+_XML_SYNTAX_ERRORS: tuple[type[Exception], ...] = (
+    (ET.ParseError, lxml_etree.XMLSyntaxError) if lxml_etree is not None else (ET.ParseError,)
+)
+
+# Attributes of a <project> and of its <copyfile> and <linkfile> children
+_ProjectEntry = tuple[dict[str, str], list[dict[str, str]], list[dict[str, str]]]
+
 # Regular expression pattern for full git commit SHA (40 hexadecimal characters)
-SHA_PATTERN = re.compile(r"^[0-9a-fA-F]{40}$")
+SHA_PATTERN = re.compile(r"^[0-9a-fA-F]{40}\Z")
+SHA_LENGTH = 40
+# Bytes removed by bytes.translate when checking a candidate SHA; anything left over is not hex
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
 
 
 def is_commit_sha(revision: str) -> bool:
@@ -24,7 +48,14 @@ def is_commit_sha(revision: str) -> bool:
     Returns:
         True if revision is a 40-character hexadecimal SHA, False otherwise
     """
-    return bool(SHA_PATTERN.match(revision))
+    # Most revisions are branch names; the length test rejects them first. The
+    # hex test deletes every hex digit in one C-level pass instead of running
+    # SHA_PATTERN through the regex engine.
+    return (
+        len(revision) == SHA_LENGTH
+        and revision.isascii()
+        and not revision.encode("ascii").translate(None, _HEX_DIGITS)
+    )
 
 
 def extract_default_branch_from_project(project: Project) -> str | None:
@@ -36,16 +67,33 @@ def extract_default_branch_from_project(project: Project) -> str | None:
     Returns:
         Branch name if revision is not a SHA, None if revision is a commit SHA
     """
-    if is_commit_sha(project.revision):
+    return _default_branch_for_revision(project.revision)
+
+
+@functools.lru_cache(maxsize=4096)
+def _default_branch_for_revision(revision: str) -> str | None:
+    """Classify a revision string, memoized because manifests repeat revisions.
+
+    Project itself is unhashable (it holds lists), so the cache is keyed on the
+    revision, which is the only input that matters.
+
+    Args:
+        revision: Revision string from manifest
+
+    Returns:
+        The revision if it is a branch name, None if it is a commit SHA
+    """
+    if is_commit_sha(revision):
         return None  # Fall back to git detection
-    return project.revision
+    return revision
 
 
-def parse_manifest(manifest_path: Path) -> Manifest:
+def parse_manifest(manifest_path: Path | bytes) -> Manifest:
     """Parse a manifest XML file and return a Manifest object.
 
     Args:
-        manifest_path: Path to the manifest XML file
+        manifest_path: Path to the manifest XML file, or the XML document itself
+            as bytes (parsed in memory)
 
     Returns:
         Parsed and validated Manifest object
@@ -54,26 +102,124 @@ def parse_manifest(manifest_path: Path) -> Manifest:
         ManifestError: If file not found or XML parsing fails
         ManifestValidationError: If manifest fails validation rules
     """
+    if isinstance(manifest_path, bytes):
+        return _parse_manifest_xml(io.BytesIO(manifest_path))
+
     # Check file exists
     if not manifest_path.exists():
         raise ManifestError(f"Manifest file not found: {manifest_path}")
 
-    # Parse XML
+    return _parse_manifest_xml(str(manifest_path))
+
+
+def parse_manifests(manifest_paths: list[Path]) -> list[Manifest]:
+    """Parse several manifest files concurrently.
+
+    File reads (and lxml's parser, when installed) release the GIL, so a thread
+    pool is used rather than processes.
+
+    Args:
+        manifest_paths: Paths to the manifest XML files
+
+    Returns:
+        Parsed manifests, in the same order as manifest_paths
+
+    Raises:
+        ManifestError: If a file is not found or XML parsing fails
+        ManifestValidationError: If a manifest fails validation rules
+    """
+    if len(manifest_paths) <= 1:
+        return [parse_manifest(path) for path in manifest_paths]
+
+    max_workers = min(len(manifest_paths), _usable_cpu_count())
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(parse_manifest, manifest_paths))
+
+
+def _iterparse(manifest_file: str | IO[bytes]) -> Iterator[tuple[str, Any]]:
+    """Iterate over start and end events of the manifest XML.
+
+    Args:
+        manifest_file: Path to the manifest XML file, or a binary stream of it
+
+    Returns:
+        Iterator of (event, element) pairs
+    """
+    if _USE_LXML:
+        # Entities are never expanded, so a manifest can't pull in external content
+        events: Iterator[tuple[str, Any]] = lxml_etree.iterparse(
+            manifest_file,
+            events=("start", "end"),
+            remove_blank_text=True,
+            resolve_entities=False,
+        )
+        return events
+    return ET.iterparse(manifest_file, events=("start", "end"))
+
+
+def _parse_manifest_xml(manifest_file: str | IO[bytes]) -> Manifest:
+    """Parse and validate the manifest XML at ``manifest_file``.
+
+    Args:
+        manifest_file: Path to the manifest XML file, or a binary stream of it
+
+    Returns:
+        Parsed and validated Manifest object
+
+    Raises:
+        ManifestError: If XML parsing fails
+        ManifestValidationError: If manifest fails validation rules
+    """
+    remote_attrs: list[dict[str, str]] = []
+    default_attrs: dict[str, str] | None = None
+    project_entries: list[_ProjectEntry] = []
+    notice: str | None = None
+    notice_found = False
+
+    # Stream the document instead of building the whole tree: each top-level
+    # element's attributes are copied out on its end event and the element is
+    # cleared. Everything is validated after the scan, so syntax errors anywhere
+    # in the file still take precedence over semantic ones.
+    depth = 0
     try:
-        tree = ET.parse(manifest_path)
-        root = tree.getroot()
-    except ET.ParseError as e:
+        for event, elem in _iterparse(manifest_file):
+            if event == "start":
+                # Verify root element
+                if depth == 0 and elem.tag != "manifest":
+                    raise ManifestError(f"Expected <manifest> root element, got <{elem.tag}>")
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth != 1:
+                continue
+            if elem.tag == "remote":
+                remote_attrs.append(dict(elem.attrib))
+            elif elem.tag == "default":
+                if default_attrs is None:
+                    default_attrs = dict(elem.attrib)
+            elif elem.tag == "project":
+                project_entries.append(
+                    (
+                        dict(elem.attrib),
+                        [dict(child.attrib) for child in elem.findall("copyfile")],
+                        [dict(child.attrib) for child in elem.findall("linkfile")],
+                    )
+                )
+            elif elem.tag == "notice" and not notice_found:
+                notice = elem.text
+                notice_found = True
+            elem.clear()
+    except ManifestError:
+        raise
+    except _XML_SYNTAX_ERRORS as e:
         raise ManifestError(f"Failed to parse manifest XML: {e}") from e
     except Exception as e:
         raise ManifestError(f"Error reading manifest file: {e}") from e
 
-    # Verify root element
-    if root.tag != "manifest":
-        raise ManifestError(f"Expected <manifest> root element, got <{root.tag}>")
-
     # Parse remotes
     remotes: dict[str, Remote] = {}
-    for remote_elem in root.findall("remote"):
+    for remote_elem in remote_attrs:
         name = remote_elem.get("name")
         fetch = remote_elem.get("fetch")
 
@@ -85,6 +231,9 @@ def parse_manifest(manifest_path: Path) -> Manifest:
         push_url = remote_elem.get("push")
         review = remote_elem.get("review")
 
+        # Remote names and revisions repeat across projects; interning them lets
+        # every Project share one string object and compare by identity first
+        name = sys.intern(name)
         remotes[name] = Remote(
             name=name,
             fetch=fetch,
@@ -95,90 +244,14 @@ def parse_manifest(manifest_path: Path) -> Manifest:
     # Parse defaults
     default_remote = None
     default_revision = None
-    default_elem = root.find("default")
-    if default_elem is not None:
-        default_remote = default_elem.get("remote")
-        default_revision = default_elem.get("revision")
+    if default_attrs is not None:
+        default_remote = default_attrs.get("remote")
+        default_revision = default_attrs.get("revision")
 
     # Parse projects
-    projects: list[Project] = []
-    for project_elem in root.findall("project"):
-        name = project_elem.get("name")
-        path = project_elem.get("path")
-
-        if not name:
-            raise ManifestError("Project element missing required 'name' attribute")
-        if not path:
-            raise ManifestError(f"Project '{name}' missing required 'path' attribute")
-
-        # Use project-specific remote or default
-        remote = project_elem.get("remote") or default_remote
-        if not remote:
-            raise ManifestError(f"Project '{name}' has no remote specified and no default remote")
-
-        # Use project-specific revision or default
-        revision = project_elem.get("revision") or default_revision or "main"
-
-        # Parse optional attributes
-        upstream = project_elem.get("upstream")
-        clone_depth_str = project_elem.get("clone-depth")
-        clone_depth = int(clone_depth_str) if clone_depth_str else None
-
-        # Parse copyfile elements
-        copyfiles: list[Copyfile] = []
-        for copyfile_elem in project_elem.findall("copyfile"):
-            src = copyfile_elem.get("src")
-            dest = copyfile_elem.get("dest")
-
-            if not src:
-                raise ManifestError(f"Project '{name}' copyfile missing required 'src' attribute")
-            if not dest:
-                raise ManifestError(f"Project '{name}' copyfile missing required 'dest' attribute")
-
-            try:
-                copyfiles.append(Copyfile(src=src, dest=dest))
-            except ValueError as e:
-                raise ManifestValidationError(
-                    f"Project '{name}' copyfile validation failed: {e}"
-                ) from e
-
-        # Parse linkfile elements
-        linkfiles: list[Linkfile] = []
-        for linkfile_elem in project_elem.findall("linkfile"):
-            src = linkfile_elem.get("src")
-            dest = linkfile_elem.get("dest")
-
-            if not src:
-                raise ManifestError(f"Project '{name}' linkfile missing required 'src' attribute")
-            if not dest:
-                raise ManifestError(f"Project '{name}' linkfile missing required 'dest' attribute")
-
-            try:
-                linkfiles.append(Linkfile(src=src, dest=dest))
-            except ValueError as e:
-                raise ManifestValidationError(
-                    f"Project '{name}' linkfile validation failed: {e}"
-                ) from e
-
-        try:
-            project = Project(
-                name=name,
-                path=path,
-                remote=remote,
-                revision=revision,
-                upstream=upstream,
-                clone_depth=clone_depth,
-                copyfiles=copyfiles,
-                linkfiles=linkfiles,
-            )
-            projects.append(project)
-        except ValueError as e:
-            # Convert ValueError from Project.__post_init__ to ManifestValidationError
-            raise ManifestValidationError(str(e)) from e
-
-    # Parse optional notice
-    notice_elem = root.find("notice")
-    notice = notice_elem.text if notice_elem is not None else None
+    projects = [
+        _build_project(entry, default_remote, default_revision) for entry in project_entries
+    ]
 
     # Create manifest object
     try:
@@ -199,6 +272,98 @@ def parse_manifest(manifest_path: Path) -> Manifest:
     return manifest
 
 
+def _build_project(
+    entry: _ProjectEntry, default_remote: str | None, default_revision: str | None
+) -> Project:
+    """Build a Project from the attributes collected for a <project> element.
+
+    Args:
+        entry: Attributes of the <project> and of its <copyfile> and <linkfile> children
+        default_remote: Remote from the manifest's <default>, if any
+        default_revision: Revision from the manifest's <default>, if any
+
+    Returns:
+        Validated Project
+
+    Raises:
+        ManifestError: If a required attribute is missing
+        ManifestValidationError: If the project fails validation rules
+    """
+    project_elem, copyfile_elems, linkfile_elems = entry
+    name = project_elem.get("name")
+    path = project_elem.get("path")
+
+    if not name:
+        raise ManifestError("Project element missing required 'name' attribute")
+    if not path:
+        raise ManifestError(f"Project '{name}' missing required 'path' attribute")
+
+    # Use project-specific remote or default
+    remote = project_elem.get("remote") or default_remote
+    if not remote:
+        raise ManifestError(f"Project '{name}' has no remote specified and no default remote")
+    remote = sys.intern(remote)
+
+    # Use project-specific revision or default
+    revision = sys.intern(project_elem.get("revision") or default_revision or "main")
+
+    # Parse optional attributes
+    upstream = project_elem.get("upstream")
+    clone_depth_str = project_elem.get("clone-depth")
+    clone_depth = int(clone_depth_str) if clone_depth_str else None
+
+    # Parse copyfile elements
+    copyfiles: list[Copyfile] = []
+    for copyfile_elem in copyfile_elems:
+        src = copyfile_elem.get("src")
+        dest = copyfile_elem.get("dest")
+
+        if not src:
+            raise ManifestError(f"Project '{name}' copyfile missing required 'src' attribute")
+        if not dest:
+            raise ManifestError(f"Project '{name}' copyfile missing required 'dest' attribute")
+
+        try:
+            copyfiles.append(Copyfile(src=src, dest=dest))
+        except ValueError as e:
+            raise ManifestValidationError(
+                f"Project '{name}' copyfile validation failed: {e}"
+            ) from e
+
+    # Parse linkfile elements
+    linkfiles: list[Linkfile] = []
+    for linkfile_elem in linkfile_elems:
+        src = linkfile_elem.get("src")
+        dest = linkfile_elem.get("dest")
+
+        if not src:
+            raise ManifestError(f"Project '{name}' linkfile missing required 'src' attribute")
+        if not dest:
+            raise ManifestError(f"Project '{name}' linkfile missing required 'dest' attribute")
+
+        try:
+            linkfiles.append(Linkfile(src=src, dest=dest))
+        except ValueError as e:
+            raise ManifestValidationError(
+                f"Project '{name}' linkfile validation failed: {e}"
+            ) from e
+
+    try:
+        return Project(
+            name=name,
+            path=path,
+            remote=remote,
+            revision=revision,
+            upstream=upstream,
+            clone_depth=clone_depth,
+            copyfiles=copyfiles,
+            linkfiles=linkfiles,
+        )
+    except ValueError as e:
+        # Convert ValueError from Project.__post_init__ to ManifestValidationError
+        raise ManifestValidationError(str(e)) from e
+
+
 def validate_manifest(manifest: Manifest) -> None:
     """Validate a manifest object according to specification rules.
 
@@ -4,12 +4,51 @@ This module defines the core data structures used throughout the application.
 All models use dataclasses with full type hints for type safety.
 """
 
+import functools
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 
 
-@dataclass(frozen=True)
+@functools.lru_cache(maxsize=256)
+def _check_remote_name(name: str) -> None:
+    """Validate a remote name, memoized since manifests repeat the same few names.
+
+    Args:
+        name: Remote name to validate
+
+    Raises:
+        ValueError: If the name is empty or contains characters other than
+            alphanumerics, '-' and '_'
+    """
+    if not name:
+        raise ValueError("Remote name cannot be empty")
+    if not name.replace("-", "").replace("_", "").isalnum():
+        raise ValueError(f"Invalid remote name: {name}")
+
+
+@functools.lru_cache(maxsize=256)
+def _check_project_path(path: str) -> None:
+    """Validate a project path, memoized so repeated paths are checked once.
+
+    Args:
+        path: Project path to validate
+
+    Raises:
+        ValueError: If the path is empty, absolute, has a trailing slash or
+            contains '..'
+    """
+    if not path:
+        raise ValueError("Project path cannot be empty")
+    if path.startswith("/") or path.endswith("/"):
+        raise ValueError(f"Project path must be relative without leading/trailing slashes: {path}")
+    if ".." in path:
+        raise ValueError(f"Project path cannot contain '..' components: {path}")
+
+
+@dataclass(frozen=True, slots=True)
 class Copyfile:
     """File copy directive from project to workspace.
 
@@ -31,7 +70,7 @@ class Copyfile:
             raise ValueError(f"Paths must be relative: src={self.src}, dest={self.dest}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Linkfile:
     """Symbolic link directive from workspace to project.
 
@@ -53,7 +92,7 @@ class Linkfile:
             raise ValueError(f"Paths must be relative: src={self.src}, dest={self.dest}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Remote:
     """Represents a named git remote repository base URL.
 
@@ -71,15 +110,12 @@ class Remote:
 
     def __post_init__(self) -> None:
         """Validate Remote attributes."""
-        if not self.name:
-            raise ValueError("Remote name cannot be empty")
-        if not self.name.replace("-", "").replace("_", "").isalnum():
-            raise ValueError(f"Invalid remote name: {self.name}")
+        _check_remote_name(self.name)
         if not self.fetch:
             raise ValueError("Remote fetch URL cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Project:
     """Represents a component repository managed as a git subtree.
 
@@ -107,14 +143,7 @@ class Project:
         """Validate Project attributes."""
         if not self.name:
             raise ValueError("Project name cannot be empty")
-        if not self.path:
-            raise ValueError("Project path cannot be empty")
-        if self.path.startswith("/") or self.path.endswith("/"):
-            raise ValueError(
-                f"Project path must be relative without leading/trailing slashes: {self.path}"
-            )
-        if ".." in self.path:
-            raise ValueError(f"Project path cannot contain '..' components: {self.path}")
+        _check_project_path(self.path)
         if not self.remote:
             raise ValueError("Project remote reference cannot be empty")
 
@@ -125,7 +154,7 @@ class Project:
         return f"{self.remote}/{self.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Manifest:
     """Represents the complete workspace configuration from manifest XML.
 
@@ -162,10 +191,14 @@ class Manifest:
                 )
 
         # Validate unique paths
-        paths = [p.path for p in self.projects]
-        if len(paths) != len(set(paths)):
-            duplicates = [p for p in paths if paths.count(p) > 1]
-            raise ValueError(f"Duplicate project paths found: {set(duplicates)}")
+        seen: set[str] = set()
+        duplicates: set[str] = set()
+        for project in self.projects:
+            if project.path in seen:
+                duplicates.add(project.path)
+            seen.add(project.path)
+        if duplicates:
+            raise ValueError(f"Duplicate project paths found: {duplicates}")
 
     def get_project_by_name(self, name: str) -> Project | None:
         """Find project by name.
@@ -305,10 +338,8 @@ class WorkspaceConfig:
         """Serialize WorkspaceConfig to JSON string.
 
         Returns:
-            JSON string representation
+            Compact JSON string representation
         """
-        import json
-
         config_dict = {
             "manifest_path": self.manifest_path,
             "manifest_hash": self.manifest_hash,
@@ -316,14 +347,14 @@ class WorkspaceConfig:
             "git_version": self.git_version,
             "subrepo_version": self.subrepo_version,
         }
-        return json.dumps(config_dict, indent=2)
+        return json.dumps(config_dict, separators=(",", ":"))
 
     @classmethod
-    def from_json(cls, json_str: str) -> "WorkspaceConfig":
+    def from_json(cls, json_str: str | bytes) -> "WorkspaceConfig":
         """Deserialize WorkspaceConfig from JSON string.
 
         Args:
-            json_str: JSON string to parse
+            json_str: JSON text to parse, as str or UTF-8 bytes
 
         Returns:
             WorkspaceConfig instance
@@ -331,8 +362,6 @@ class WorkspaceConfig:
         Raises:
             ValueError: If JSON is invalid or missing required fields
         """
-        import json
-
         try:
             config_dict = json.loads(json_str)
             return cls(
@@ -346,7 +375,24 @@ class WorkspaceConfig:
             raise ValueError(f"Invalid WorkspaceConfig JSON: {e}") from e
 
 
-@dataclass
+@dataclass(frozen=True)
+class GitCommandSpec:
+    """A git command to be executed, used for batched execution.
+
+    Attributes:
+        args: Git command arguments (e.g., ["fetch", "origin"])
+        cwd: Working directory for command execution
+        check: Whether to raise exception on failure
+        timeout: Command timeout in seconds
+    """
+
+    args: list[str]
+    cwd: Path | None = None
+    check: bool = True
+    timeout: int = 300
+
+
+@dataclass(frozen=True, slots=True)
 class GitOperationResult:
     """Result of a git command execution.
 
@@ -402,7 +448,26 @@ class PushAction(Enum):
     SKIPPED = "skipped"  # Push skipped due to error
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class PushItem:
+    """A component subtree to push as part of a batch.
+
+    Attributes:
+        component_name: Name of the component (for error messages)
+        component_path: Local path to component subtree
+        remote_url: Remote repository URL
+        branch_name: Branch name to push to
+        force: Whether to force push
+    """
+
+    component_name: str
+    component_path: Path
+    remote_url: str
+    branch_name: str
+    force: bool = False
+
+
+@dataclass(frozen=True, slots=True)
 class PushResult:
     """Result of pushing a single component.
 
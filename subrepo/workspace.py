@@ -4,7 +4,7 @@ Provides functions to initialize subrepo workspaces and manage workspace configu
 """
 
 import hashlib
-import json
+import os
 import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
@@ -13,6 +13,9 @@ from .exceptions import GitOperationError, WorkspaceError
 from .git_commands import GitOperationResult
 from .models import Manifest, WorkspaceConfig
 
+# os.open defaults to text mode on Windows; config files are read and written as raw bytes
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
 
 def init_workspace(
     workspace_path: Path,
@@ -147,16 +150,32 @@ def _create_initial_commit(repo_path: Path) -> None:
     readme_path = repo_path / "README.md"
     readme_path.write_text("# Subrepo Workspace\n\nInitialized by subrepo tool.\n")
 
-    # Stage and commit
+    # Stage, then commit with plumbing: commit-tree skips the hooks, status
+    # summary and auto-maintenance that porcelain commit runs
     subprocess.run(
         ["git", "add", "README.md"],
         cwd=repo_path,
         check=True,
         capture_output=True,
     )
+    tree = subprocess.run(
+        ["git", "write-tree"],
+        cwd=repo_path,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    commit = subprocess.run(
+        ["git", "commit-tree", tree, "-m", "Initial commit"],
+        cwd=repo_path,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
 
+    # HEAD is a symbolic ref to the unborn default branch, so this creates it
     subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
+        ["git", "update-ref", "-m", "commit (initial): Initial commit", "HEAD", commit],
         cwd=repo_path,
         check=True,
         capture_output=True,
@@ -172,18 +191,9 @@ def save_workspace_config(workspace_path: Path, config: WorkspaceConfig) -> None
     """
     config_path = workspace_path / ".subrepo" / "config.json"
 
-    # Convert config to dict for JSON serialization
-    config_dict = {
-        "manifest_path": config.manifest_path,
-        "manifest_hash": config.manifest_hash,
-        "initialized_at": config.initialized_at.isoformat(),
-        "git_version": config.git_version,
-        "subrepo_version": config.subrepo_version,
-    }
-
     # Write atomically using temp file + rename
     temp_path = config_path.with_suffix(".json.tmp")
-    temp_path.write_text(json.dumps(config_dict, indent=2))
+    _write_bytes(temp_path, config.to_json().encode())
     temp_path.rename(config_path)
 
 
@@ -201,23 +211,60 @@ def load_workspace_config(workspace_path: Path) -> WorkspaceConfig:
     """
     config_path = workspace_path / ".subrepo" / "config.json"
 
-    if not config_path.exists():
+    try:
+        data = _read_bytes(config_path)
+    except FileNotFoundError:
         raise WorkspaceError(
             f"Not a subrepo workspace: {workspace_path}\nMissing .subrepo/config.json file."
-        )
+        ) from None
 
     try:
-        config_dict = json.loads(config_path.read_text())
-
-        return WorkspaceConfig(
-            manifest_path=config_dict["manifest_path"],
-            manifest_hash=config_dict["manifest_hash"],
-            initialized_at=datetime.fromisoformat(config_dict["initialized_at"]),
-            git_version=config_dict["git_version"],
-            subrepo_version=config_dict["subrepo_version"],
-        )
-    except (KeyError, ValueError, json.JSONDecodeError) as e:
-        raise WorkspaceError(f"Invalid workspace config file: {e}") from e
+        return WorkspaceConfig.from_json(data)
+    except ValueError as e:
+        # Report the underlying parse error; from_json's own prefix would repeat ours
+        raise WorkspaceError(f"Invalid workspace config file: {e.__cause__ or e}") from e
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path through a raw file descriptor.
+
+    Config files are a few hundred bytes, so bypassing the buffered text layer
+    leaves one open/write/close per save.
+
+    Args:
+        path: File to create or truncate
+        data: Bytes to write
+    """
+    # 0o666 masked by the umask, the same mode open() would create the file with
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read the whole file at path through a raw file descriptor.
+
+    Args:
+        path: File to read
+
+    Returns:
+        File contents
+
+    Raises:
+        FileNotFoundError: If path does not exist
+    """
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
 
 
 def _compute_manifest_hash(manifest: Manifest) -> str:
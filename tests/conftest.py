@@ -43,3 +43,15 @@ def preserve_cwd():
     except (FileNotFoundError, OSError):
         # If original directory was deleted, change to a safe location
         os.chdir(Path(__file__).parent.parent)
+
+
+@pytest.fixture(autouse=True)
+def close_cat_file_sessions():
+    """Close git sessions so tests don't observe each other's mocks."""
+    from subrepo.git_commands import close_git_sessions
+
+    close_git_sessions()
+
+    yield
+
+    close_git_sessions()
@@ -0,0 +1,42 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from subrepo.models import GitOperationResult, Manifest, Project, Remote
+
+
+@pytest.fixture(scope="session")
+def origin_remote():
+    """The "origin" remote most model tests build on (immutable, shared)."""
+    return Remote(name="origin", fetch="https://github.com/")
+
+
+@pytest.fixture(scope="session")
+def sample_project():
+    """A minimal project on the origin remote (immutable, shared)."""
+    return Project(name="org/repo", path="lib/repo", remote="origin")
+
+
+@pytest.fixture(scope="session")
+def sample_manifest(origin_remote, sample_project):
+    """A manifest holding only sample_project; tests must not mutate it."""
+    return Manifest(remotes={"origin": origin_remote}, projects=[sample_project])
+
+
+@pytest.fixture
+def make_git_result():
+    """Build a GitOperationResult for ``git status``, overriding only the given fields."""
+
+    def _make(**overrides):
+        fields = {
+            "success": True,
+            "stdout": "",
+            "stderr": "",
+            "exit_code": 0,
+            "duration": 1.0,
+            "command": ["git", "status"],
+        }
+        fields.update(overrides)
+        return GitOperationResult(**fields)
+
+    return _make
@@ -27,7 +27,8 @@ class TestDetectCurrentBranch:
         assert result == "feature-branch"
         mock_run.assert_called_once()
         args = mock_run.call_args[0][0]
-        assert args == ["git", "symbolic-ref", "--short", "HEAD"]
+        assert Path(args[0]).name == "git"
+        assert args[1:] == ["--no-optional-locks", "symbolic-ref", "--short", "HEAD"]
 
     @patch("subrepo.git_commands.subprocess.run")
     def test_strips_whitespace(self, mock_run: MagicMock) -> None:
@@ -107,8 +108,9 @@ class TestDetectDefaultBranch:
         detect_default_branch()
 
         args = mock_run.call_args[0][0]
-        assert args == [
-            "git",
+        assert Path(args[0]).name == "git"
+        assert args[1:] == [
+            "--no-optional-locks",
             "symbolic-ref",
             "--short",
             "refs/remotes/origin/HEAD",
@@ -142,3 +144,13 @@ class TestDetectDefaultBranch:
         detect_default_branch()
 
         assert mock_run.call_args[1]["text"] is True
+
+    @patch("subrepo.git_commands.subprocess.run")
+    def test_discards_stderr(self, mock_run: MagicMock) -> None:
+        """Test that stderr is sent to DEVNULL since failures fall back to 'main'."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="origin/main\n", stderr=None)
+
+        detect_default_branch()
+
+        assert mock_run.call_args[1]["stdout"] is subprocess.PIPE
+        assert mock_run.call_args[1]["stderr"] is subprocess.DEVNULL
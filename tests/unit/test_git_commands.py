@@ -1,12 +1,19 @@
 """Unit tests for git command wrappers."""
 
+import asyncio
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from subrepo.exceptions import GitCommandError
 from subrepo.git_commands import (
+    gather_git_commands,
     git_add,
     git_commit,
     git_fetch,
@@ -15,15 +22,19 @@ from subrepo.git_commands import (
     git_remote_add,
     git_rev_list,
     git_rev_parse,
+    git_rev_parse_many,
     git_status,
     git_subtree_add,
     git_subtree_pull,
     git_subtree_push,
     git_subtree_split,
+    git_subtree_split_many,
     git_version,
     run_git_command,
+    run_git_command_async,
+    run_git_commands_parallel,
 )
-from subrepo.models import GitOperationResult
+from subrepo.models import GitCommandSpec
 
 
 class TestRunGitCommand:
@@ -34,8 +45,8 @@ class TestRunGitCommand:
         """Test successful git command execution."""
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "success output"
-        mock_result.stderr = ""
+        mock_result.stdout = b"success output"
+        mock_result.stderr = b""
         mock_run.return_value = mock_result
 
         result = run_git_command(["status"])
@@ -45,14 +56,28 @@ class TestRunGitCommand:
         assert result.exit_code == 0
         assert result.command == ["git", "status"]
         mock_run.assert_called_once()
+        env = mock_run.call_args[1]["env"]
+        assert env["GIT_OPTIONAL_LOCKS"] == "0"
+        assert env["GIT_TERMINAL_PROMPT"] == "0"
+        assert env["LC_ALL"] == "C"
+
+    @patch.dict("os.environ", {"GIT_TERMINAL_PROMPT": "1"})
+    @patch("subprocess.run")
+    def test_run_git_command_keeps_explicit_terminal_prompt(self, mock_run):
+        """Test a GIT_TERMINAL_PROMPT set by the user is not overridden."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+        run_git_command(["fetch", "origin"])
+
+        assert mock_run.call_args[1]["env"]["GIT_TERMINAL_PROMPT"] == "1"
 
     @patch("subprocess.run")
     def test_run_git_command_failure_with_check(self, mock_run):
         """Test git command failure with check=True raises exception."""
         mock_result = MagicMock()
         mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "fatal: error"
+        mock_result.stdout = b""
+        mock_result.stderr = b"fatal: error"
         mock_run.return_value = mock_result
 
         with pytest.raises(GitCommandError) as exc_info:
@@ -67,8 +92,8 @@ class TestRunGitCommand:
         """Test git command failure with check=False returns result."""
         mock_result = MagicMock()
         mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "fatal: error"
+        mock_result.stdout = b""
+        mock_result.stderr = b"fatal: error"
         mock_run.return_value = mock_result
 
         result = run_git_command(["invalid"], check=False)
@@ -82,36 +107,64 @@ class TestRunGitCommand:
         """Test git command with working directory."""
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
+        mock_result.stdout = b""
+        mock_result.stderr = b""
         mock_run.return_value = mock_result
 
         path = Path("/tmp/repo")
-        run_git_command(["status"], cwd=path)
+        result = run_git_command(["status"], cwd=path)
+
+        argv = mock_run.call_args[0][0]
+        assert argv[1:] == ["-C", str(path), "status"]
+        assert result.command == ["git", "status"]
 
-        call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["cwd"] == path
+    @patch("subprocess.run")
+    def test_run_git_command_is_posix_spawn_eligible(self, mock_run):
+        """Test git is started by absolute path without cwd= so posix_spawn can be used."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+        run_git_command(["status"], cwd=Path("/tmp/repo"))
+
+        argv = mock_run.call_args[0][0]
+        assert Path(argv[0]).name == "git"
+        assert "cwd" not in mock_run.call_args[1]
+
+    @patch("subprocess.run")
+    def test_read_only_commands_always_run_git(self, mock_run):
+        """Test repeated reads are not memoized, so changes made outside this module show up."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"abc123\n", stderr=b"")
+
+        path = Path("/tmp/repo")
+        run_git_command(["rev-parse", "HEAD"], cwd=path)
+        run_git_command(["rev-parse", "HEAD"], cwd=path)
+
+        assert mock_run.call_count == 2
 
 
 class TestGitVersion:
     """Tests for git_version function."""
 
+    def setup_method(self):
+        """Reset the memoized git version."""
+        git_version.cache_clear()
+
+    @pytest.mark.parametrize("stdout", ["git version 2.43.0\n", "2.43.0\n"])
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_version_returns_version_string(self, mock_run):
-        """Test git_version extracts version from output."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="git version 2.43.0\n",
-            stderr="",
-            exit_code=0,
-            duration=0.1,
-            command=["git", "--version"],
-        )
-        mock_run.return_value = mock_result
+    def test_git_version_returns_version_string(self, mock_run, make_git_result, stdout):
+        """Test git_version extracts the version with or without the 'git version' prefix."""
+        mock_run.return_value = make_git_result(stdout=stdout, command=["git", "--version"])
 
-        version = git_version()
+        assert git_version() == "2.43.0"
+        mock_run.assert_called_once_with(["--version"])
 
-        assert version == "2.43.0"
+    @patch("subrepo.git_commands.run_git_command")
+    def test_git_version_is_memoized(self, mock_run, make_git_result):
+        """Test git --version only runs once per process."""
+        mock_run.return_value = make_git_result(
+            stdout="git version 2.43.0\n", command=["git", "--version"]
+        )
+
+        assert git_version() == git_version() == "2.43.0"
         mock_run.assert_called_once_with(["--version"])
 
 
@@ -119,17 +172,9 @@ class TestGitInit:
     """Tests for git_init function."""
 
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_init_calls_command(self, mock_run):
+    def test_git_init_calls_command(self, mock_run, make_git_result):
         """Test git_init calls git init command."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="Initialized empty Git repository",
-            stderr="",
-            exit_code=0,
-            duration=0.1,
-            command=["git", "init"],
-        )
-        mock_run.return_value = mock_result
+        mock_run.return_value = make_git_result(stdout="Initialized empty Git repository")
 
         path = Path("/tmp/repo")
         result = git_init(path)
@@ -141,58 +186,25 @@ class TestGitInit:
 class TestGitAdd:
     """Tests for git_add function."""
 
+    @pytest.mark.parametrize("files", [["file.txt"], ["file1.txt", "file2.txt"]])
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_add_single_file(self, mock_run):
-        """Test adding a single file."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="",
-            stderr="",
-            exit_code=0,
-            duration=0.1,
-            command=["git", "add", "file.txt"],
-        )
-        mock_run.return_value = mock_result
+    def test_git_add(self, mock_run, make_git_result, files):
+        """Test adding one or more files."""
+        mock_run.return_value = make_git_result()
 
         path = Path("/tmp/repo")
-        git_add(path, ["file.txt"])
+        git_add(path, files)
 
-        mock_run.assert_called_once_with(["add", "file.txt"], cwd=path)
-
-    @patch("subrepo.git_commands.run_git_command")
-    def test_git_add_multiple_files(self, mock_run):
-        """Test adding multiple files."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="",
-            stderr="",
-            exit_code=0,
-            duration=0.1,
-            command=["git", "add", "file1.txt", "file2.txt"],
-        )
-        mock_run.return_value = mock_result
-
-        path = Path("/tmp/repo")
-        git_add(path, ["file1.txt", "file2.txt"])
-
-        mock_run.assert_called_once_with(["add", "file1.txt", "file2.txt"], cwd=path)
+        mock_run.assert_called_once_with(["add", *files], cwd=path)
 
 
 class TestGitCommit:
     """Tests for git_commit function."""
 
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_commit(self, mock_run):
+    def test_git_commit(self, mock_run, make_git_result):
         """Test creating a commit."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="[main abc1234] commit message",
-            stderr="",
-            exit_code=0,
-            duration=0.1,
-            command=["git", "commit", "-m", "commit message"],
-        )
-        mock_run.return_value = mock_result
+        mock_run.return_value = make_git_result(stdout="[main abc1234] commit message")
 
         path = Path("/tmp/repo")
         result = git_commit(path, "commit message")
@@ -204,176 +216,303 @@ class TestGitCommit:
 class TestGitSubtree:
     """Tests for git subtree functions."""
 
+    @pytest.mark.parametrize(("squash", "expect_squash"), [(True, True), (False, False)])
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_subtree_add_with_squash(self, mock_run):
-        """Test adding a subtree with squash."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="Added subtree",
-            stderr="",
-            exit_code=0,
-            duration=5.0,
-            command=["git", "subtree", "add"],
-        )
-        mock_run.return_value = mock_result
+    def test_git_subtree_add(self, mock_run, make_git_result, squash, expect_squash):
+        """Test adding a subtree with and without squash."""
+        mock_run.return_value = make_git_result(stdout="Added subtree")
 
         path = Path("/tmp/repo")
-        git_subtree_add(path, "lib/component", "https://example.com/repo", "main")
+        git_subtree_add(path, "lib/component", "https://example.com/repo", "main", squash=squash)
 
         args = mock_run.call_args[0][0]
-        assert "subtree" in args
-        assert "add" in args
-        assert "--prefix=lib/component" in args
-        assert "--squash" in args
+        assert args[:3] == ["subtree", "add", "--prefix=lib/component"]
         assert "main" in args
+        assert ("--squash" in args) is expect_squash
 
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_subtree_add_without_squash(self, mock_run):
-        """Test adding a subtree without squash."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="Added subtree",
-            stderr="",
-            exit_code=0,
-            duration=5.0,
-            command=["git", "subtree", "add"],
-        )
-        mock_run.return_value = mock_result
-
-        path = Path("/tmp/repo")
-        git_subtree_add(path, "lib/component", "https://example.com/repo", "main", squash=False)
-
-        args = mock_run.call_args[0][0]
-        assert "--squash" not in args
-
-    @patch("subrepo.git_commands.run_git_command")
-    def test_git_subtree_pull(self, mock_run):
+    def test_git_subtree_pull(self, mock_run, make_git_result):
         """Test pulling subtree updates."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="Subtree pulled",
-            stderr="",
-            exit_code=0,
-            duration=5.0,
-            command=["git", "subtree", "pull"],
-        )
-        mock_run.return_value = mock_result
+        mock_run.return_value = make_git_result(stdout="Subtree pulled")
 
         path = Path("/tmp/repo")
         git_subtree_pull(path, "lib/component", "origin", "main")
 
         args = mock_run.call_args[0][0]
-        assert "subtree" in args
-        assert "pull" in args
-        assert "--prefix=lib/component" in args
+        assert args[:3] == ["subtree", "pull", "--prefix=lib/component"]
         assert "--squash" in args
 
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_subtree_push(self, mock_run):
+    def test_git_subtree_push(self, mock_run, make_git_result):
         """Test pushing subtree changes."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="Subtree pushed",
-            stderr="",
-            exit_code=0,
-            duration=5.0,
-            command=["git", "subtree", "push"],
-        )
-        mock_run.return_value = mock_result
+        mock_run.return_value = make_git_result(stdout="Subtree pushed")
 
         path = Path("/tmp/repo")
         git_subtree_push(path, "lib/component", "origin", "main")
 
         args = mock_run.call_args[0][0]
-        assert "subtree" in args
-        assert "push" in args
-        assert "--prefix=lib/component" in args
+        assert args[:3] == ["subtree", "push", "--prefix=lib/component"]
 
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_subtree_split_with_branch(self, mock_run):
+    def test_git_subtree_split_with_branch(self, mock_run, make_git_result):
         """Test splitting subtree with branch creation."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="abc123def456",
-            stderr="",
-            exit_code=0,
-            duration=3.0,
-            command=["git", "subtree", "split"],
-        )
-        mock_run.return_value = mock_result
+        mock_run.return_value = make_git_result(stdout="abc123def456")
 
         path = Path("/tmp/repo")
         git_subtree_split(path, "lib/component", branch="temp-split")
 
         args = mock_run.call_args[0][0]
-        assert "subtree" in args
-        assert "split" in args
-        assert "--prefix=lib/component" in args
-        assert "--branch" in args
-        assert "temp-split" in args
+        assert args == ["subtree", "split", "--prefix=lib/component", "--branch", "temp-split"]
+
+    @patch("subrepo.git_commands.run_git_commands_parallel")
+    def test_git_subtree_split_many(self, mock_parallel, make_git_result):
+        """Test several prefixes are split in one parallel batch keyed by prefix."""
+        mock_parallel.side_effect = lambda specs: [
+            make_git_result(stdout=spec.args[2], command=["git", *spec.args]) for spec in specs
+        ]
+
+        path = Path("/tmp/repo")
+        results = git_subtree_split_many(path, [("lib/a", "split-a"), ("lib/b", None)])
+
+        mock_parallel.assert_called_once()
+        specs = mock_parallel.call_args[0][0]
+        assert specs[0].args == ["subtree", "split", "--prefix=lib/a", "--branch", "split-a"]
+        assert specs[1].args == ["subtree", "split", "--prefix=lib/b"]
+        assert all(spec.cwd == path for spec in specs)
+        assert results["lib/a"].stdout == "--prefix=lib/a"
+        assert results["lib/b"].stdout == "--prefix=lib/b"
 
 
 class TestGitStatus:
     """Tests for git_status function."""
 
+    @pytest.mark.parametrize(
+        ("short", "expected_args"),
+        [(False, ["status"]), (True, ["status", "--short"])],
+    )
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_status_default(self, mock_run):
-        """Test git status with default format."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="On branch main",
-            stderr="",
-            exit_code=0,
-            duration=0.1,
-            command=["git", "status"],
-        )
-        mock_run.return_value = mock_result
+    def test_git_status(self, mock_run, make_git_result, short, expected_args):
+        """Test git status in default and short format."""
+        mock_run.return_value = make_git_result(stdout=" M file.txt")
 
         path = Path("/tmp/repo")
-        git_status(path)
+        git_status(path, short=short)
 
-        mock_run.assert_called_once_with(["status"], cwd=path)
+        mock_run.assert_called_once_with(expected_args, cwd=path)
+
+
+class TestGitRevParse:
+    """Tests for git_rev_parse function."""
+
+    @patch("subrepo.git_commands._GitSession")
+    def test_git_rev_parse_returns_sha(self, mock_session_cls):
+        """Test rev-parse returns commit SHA from the batch session."""
+        mock_session_cls.return_value.resolve.return_value = "abc123def456789"
+
+        path = Path("/tmp/repo")
+        sha = git_rev_parse(path, "HEAD")
+
+        assert sha == "abc123def456789"
+        mock_session_cls.assert_called_once_with(str(path.resolve()))
+        mock_session_cls.return_value.resolve.assert_called_once_with("HEAD")
+
+    @patch("subprocess.Popen")
+    def test_git_rev_parse_reuses_session(self, mock_popen):
+        """Test N lookups in one repository use a single process and N writes."""
+        stdin_read, stdin_write = os.pipe()
+        stdout_read, stdout_write = os.pipe()
+        proc = mock_popen.return_value
+        proc.stdin.fileno.return_value = stdin_write
+        proc.stdout.fileno.return_value = stdout_read
+        # All responses arrive in one read and must be split into lines
+        os.write(stdout_write, b"abc123 commit 210\ndef456 commit 190\n789abc tag 140\n")
+
+        try:
+            path = Path("/tmp/repo")
+            shas = [git_rev_parse(path, ref) for ref in ("HEAD", "main", "v1.0")]
+            requests = os.read(stdin_read, 4096)
+        finally:
+            for fd in (stdin_read, stdin_write, stdout_read, stdout_write):
+                os.close(fd)
+
+        assert shas == ["abc123", "def456", "789abc"]
+        mock_popen.assert_called_once()
+        argv = mock_popen.call_args[0][0]
+        assert Path(argv[0]).name == "git"
+        assert argv[1:] == ["-C", str(path.resolve()), "cat-file", "--batch-command"]
+        assert "cwd" not in mock_popen.call_args[1]
+        assert mock_popen.call_args[1]["env"]["LC_ALL"] == "C"
+        assert requests == b"info HEAD\ninfo main\ninfo v1.0\n"
+
+    @patch("subprocess.Popen")
+    def test_git_rev_parse_session_exit_falls_back(self, mock_popen, make_git_result):
+        """Test a batch process that closes its output is dropped for rev-parse."""
+        stdin_read, stdin_write = os.pipe()
+        stdout_read, stdout_write = os.pipe()
+        proc = mock_popen.return_value
+        proc.returncode = 1
+        proc.stdin.fileno.return_value = stdin_write
+        proc.stdout.fileno.return_value = stdout_read
+        os.close(stdout_write)
+
+        try:
+            with patch("subrepo.git_commands.run_git_command") as mock_run:
+                mock_run.return_value = make_git_result(stdout="abc123\n")
+                sha = git_rev_parse(Path("/tmp/repo"), "HEAD")
+        finally:
+            for fd in (stdin_read, stdin_write, stdout_read):
+                os.close(fd)
+
+        assert sha == "abc123"
+        mock_run.assert_called_once_with(["rev-parse", "HEAD"], cwd=Path("/tmp/repo"))
 
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_status_short(self, mock_run):
-        """Test git status with short format."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout=" M file.txt",
-            stderr="",
-            exit_code=0,
-            duration=0.1,
-            command=["git", "status", "--short"],
-        )
-        mock_run.return_value = mock_result
+    @patch("subrepo.git_commands._GitSession")
+    def test_git_rev_parse_does_not_restart_failed_session(
+        self, mock_session_cls, mock_run, make_git_result
+    ):
+        """Test a directory whose session failed is not given a new process per lookup."""
+        mock_session_cls.return_value.resolve.side_effect = BrokenPipeError
+        mock_session_cls.return_value.proc.returncode = 128
+        mock_run.return_value = make_git_result(stdout="abc123\n")
+
+        path = Path("/tmp/not-a-repo")
+        git_rev_parse(path, "HEAD")
+        git_rev_parse(path, "main")
+
+        mock_session_cls.assert_called_once_with(str(path.resolve()))
+        assert mock_run.call_count == 2
+
+    @patch("subrepo.git_commands._GitSession")
+    def test_git_rev_parse_relative_path_follows_chdir(
+        self, mock_session_cls, tmp_path, monkeypatch
+    ):
+        """Test a relative path gets the session of the current directory, not a stale one."""
+        sessions = {}
+
+        def start_session(cwd):
+            sessions[cwd] = MagicMock()
+            sessions[cwd].resolve.return_value = f"sha-of-{Path(cwd).name}"
+            return sessions[cwd]
+
+        mock_session_cls.side_effect = start_session
+        for name in ("ra", "rb"):
+            (tmp_path / name).mkdir()
+
+        monkeypatch.chdir(tmp_path / "ra")
+        first = git_rev_parse(Path(), "HEAD")
+        monkeypatch.chdir(tmp_path / "rb")
+        second = git_rev_parse(Path(), "HEAD")
+
+        assert (first, second) == ("sha-of-ra", "sha-of-rb")
+        assert list(sessions) == [
+            str((tmp_path / "ra").resolve()),
+            str((tmp_path / "rb").resolve()),
+        ]
+
+    @patch("subprocess.Popen")
+    @patch("subrepo.git_commands.run_git_command")
+    def test_git_rev_parse_never_sends_whitespace_to_session(
+        self, mock_run, mock_popen, make_git_result
+    ):
+        """Test refs containing whitespace go to rev-parse so the session stays in sync."""
+        mock_run.return_value = make_git_result(stdout="abc123\n")
+
+        with patch("subrepo.git_commands.os.write") as mock_write:
+            git_rev_parse(Path("/tmp/repo"), "HEAD\ninfo main")
+
+        mock_write.assert_not_called()
+        mock_run.assert_called_once_with(["rev-parse", "HEAD\ninfo main"], cwd=Path("/tmp/repo"))
+
+    @patch("subrepo.git_commands._GitSession")
+    def test_git_rev_parse_starts_one_session_across_threads(self, mock_session_cls):
+        """Test concurrent lookups in one repository share a single session."""
+
+        def start_session(cwd):
+            time.sleep(0.01)
+            return mock_session
+
+        mock_session = MagicMock()
+        mock_session.resolve.return_value = "abc123"
+        mock_session_cls.side_effect = start_session
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            shas = list(executor.map(lambda _: git_rev_parse(Path("/tmp/repo"), "HEAD"), range(8)))
+
+        assert shas == ["abc123"] * 8
+        mock_session_cls.assert_called_once_with("/tmp/repo")
+
+    @patch("subrepo.git_commands.run_git_command")
+    @patch("subrepo.git_commands._GitSession")
+    def test_git_rev_parse_falls_back_for_unresolved_ref(self, mock_session_cls, mock_run):
+        """Test refs the session cannot resolve are retried with git rev-parse."""
+        mock_session_cls.return_value.resolve.return_value = None
+        mock_run.side_effect = GitCommandError("failed", ["git", "rev-parse"], 128, "fatal")
 
         path = Path("/tmp/repo")
-        git_status(path, short=True)
+        with pytest.raises(GitCommandError):
+            git_rev_parse(path, "missing")
 
-        mock_run.assert_called_once_with(["status", "--short"], cwd=path)
+        mock_run.assert_called_once_with(["rev-parse", "missing"], cwd=path)
 
+    @pytest.mark.parametrize("stdout", ["abc123\n", "abc123", "abc123  "])
+    @patch("subrepo.git_commands.run_git_command")
+    @patch("subrepo.git_commands._GitSession")
+    def test_git_rev_parse_fallback_trims_output(
+        self, mock_session_cls, mock_run, stdout, make_git_result
+    ):
+        """Test the rev-parse fallback returns the bare SHA however output is terminated."""
+        mock_session_cls.return_value.resolve.return_value = None
+        mock_run.return_value = make_git_result(stdout=stdout, command=["git", "rev-parse", "HEAD"])
 
-class TestGitRevParse:
-    """Tests for git_rev_parse function."""
+        assert git_rev_parse(Path("/tmp/repo"), "HEAD") == "abc123"
+
+
+class TestGitRevParseBatch:
+    """Tests for git_rev_parse_many function."""
 
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_rev_parse_returns_sha(self, mock_run):
-        """Test rev-parse returns commit SHA."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="abc123def456789\n",
-            stderr="",
-            exit_code=0,
-            duration=0.1,
-            command=["git", "rev-parse", "HEAD"],
+    def test_resolves_refs_in_one_call(self, mock_run, make_git_result):
+        """Test several refs are resolved by a single rev-parse invocation."""
+        refs = ["HEAD", "main", "develop", "v1.0", "HEAD~1"]
+        mock_run.return_value = make_git_result(
+            stdout="aaa111\nbbb222\nccc333\nddd444\neee555\n",
+            command=["git", "rev-parse", *refs],
         )
-        mock_run.return_value = mock_result
 
         path = Path("/tmp/repo")
-        sha = git_rev_parse(path, "HEAD")
+        shas = git_rev_parse_many(path, refs)
 
-        assert sha == "abc123def456789"
-        mock_run.assert_called_once_with(["rev-parse", "HEAD"], cwd=path)
+        assert shas == {
+            "HEAD": "aaa111",
+            "main": "bbb222",
+            "develop": "ccc333",
+            "v1.0": "ddd444",
+            "HEAD~1": "eee555",
+        }
+        mock_run.assert_called_once_with(["rev-parse", *refs], cwd=path)
+
+    @patch("subrepo.git_commands.run_git_command")
+    def test_empty_refs_skips_git(self, mock_run):
+        """Test no git process is started for an empty ref list."""
+        assert git_rev_parse_many(Path("/tmp/repo"), []) == {}
+        mock_run.assert_not_called()
+
+    @pytest.mark.parametrize("ref", ["main..develop", "--all", "HEAD^!", "HEAD^@", "HEAD^-", ""])
+    @patch("subrepo.git_commands.run_git_command")
+    def test_rejects_arguments_that_are_not_single_refs(self, mock_run, ref):
+        """Test options and ranges are refused before git runs."""
+        with pytest.raises(ValueError, match="Not a single ref"):
+            git_rev_parse_many(Path("/tmp/repo"), ["HEAD", ref])
+        mock_run.assert_not_called()
+
+    @patch("subrepo.git_commands.run_git_command")
+    def test_line_count_mismatch_raises_git_error(self, mock_run, make_git_result):
+        """Test output that does not line up with the refs is reported as a git failure."""
+        mock_run.return_value = make_git_result(stdout="aaa111\n")
+
+        with pytest.raises(GitCommandError, match="1 lines for 2 refs"):
+            git_rev_parse_many(Path("/tmp/repo"), ["HEAD", "main"])
 
 
 class TestGitCommandTimeout:
@@ -382,53 +521,19 @@ class TestGitCommandTimeout:
     @patch("subprocess.run")
     def test_run_git_command_timeout(self, mock_run):
         """Test git command timeout raises GitCommandError."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.TimeoutExpired(
-            cmd=["git", "fetch"], timeout=30
-        )
+        mock_run.side_effect = subprocess.TimeoutExpired(cmd=["git", "fetch"], timeout=30)
 
         with pytest.raises(GitCommandError, match="timed out"):
             run_git_command(["fetch"], timeout=30)
 
 
-class TestGitVersion:
-    """Additional tests for git_version function."""
-
-    @patch("subrepo.git_commands.run_git_command")
-    def test_git_version_without_prefix(self, mock_run):
-        """Test git_version handles output without 'git version' prefix."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="2.43.0\n",
-            stderr="",
-            exit_code=0,
-            duration=0.1,
-            command=["git", "--version"],
-        )
-        mock_run.return_value = mock_result
-
-        version = git_version()
-
-        # Should return the raw string if it doesn't start with "git version"
-        assert version == "2.43.0"
-
-
 class TestGitRemoteAdd:
     """Tests for git_remote_add function."""
 
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_remote_add_success(self, mock_run):
+    def test_git_remote_add_success(self, mock_run, make_git_result):
         """Test adding a git remote."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="",
-            stderr="",
-            exit_code=0,
-            duration=0.1,
-            command=["git", "remote", "add", "origin", "https://example.com/repo"],
-        )
-        mock_run.return_value = mock_result
+        mock_run.return_value = make_git_result()
 
         path = Path("/tmp/repo")
         result = git_remote_add(path, "origin", "https://example.com/repo")
@@ -442,152 +547,230 @@ class TestGitRemoteAdd:
 class TestGitFetch:
     """Tests for git_fetch function."""
 
+    @pytest.mark.parametrize(
+        ("ref", "expected_args"),
+        [(None, ["fetch", "origin"]), ("main", ["fetch", "origin", "main"])],
+    )
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_fetch_without_ref(self, mock_run):
-        """Test fetching from remote without specific ref."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="From origin...",
-            stderr="",
-            exit_code=0,
-            duration=2.0,
-            command=["git", "fetch", "origin"],
-        )
-        mock_run.return_value = mock_result
+    def test_git_fetch(self, mock_run, make_git_result, ref, expected_args):
+        """Test fetching from a remote with and without a specific ref."""
+        mock_run.return_value = make_git_result(stdout="From origin...")
 
         path = Path("/tmp/repo")
-        result = git_fetch(path, "origin")
+        result = git_fetch(path, "origin", ref)
 
         assert result.success
-        mock_run.assert_called_once_with(["fetch", "origin"], cwd=path)
-
-    @patch("subrepo.git_commands.run_git_command")
-    def test_git_fetch_with_ref(self, mock_run):
-        """Test fetching specific ref from remote."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="From origin...",
-            stderr="",
-            exit_code=0,
-            duration=2.0,
-            command=["git", "fetch", "origin", "main"],
-        )
-        mock_run.return_value = mock_result
-
-        path = Path("/tmp/repo")
-        result = git_fetch(path, "origin", "main")
-
-        assert result.success
-        mock_run.assert_called_once_with(["fetch", "origin", "main"], cwd=path)
+        mock_run.assert_called_once_with(expected_args, cwd=path)
 
 
 class TestGitLog:
     """Tests for git_log function."""
 
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_args"),
+        [
+            ({"oneline": True}, ["log", "--oneline"]),
+            ({"paths": ["lib/component"]}, ["log", "--", "lib/component"]),
+            (
+                {"revision_range": "HEAD~5..HEAD", "limit": 10},
+                ["log", "-n", "10", "HEAD~5..HEAD"],
+            ),
+        ],
+    )
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_log_oneline(self, mock_run):
-        """Test git log with oneline format."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="abc123 commit message\n",
-            stderr="",
-            exit_code=0,
-            duration=0.5,
-            command=["git", "log", "--oneline"],
-        )
-        mock_run.return_value = mock_result
+    def test_git_log(self, mock_run, make_git_result, kwargs, expected_args):
+        """Test git log argument construction for each option."""
+        mock_run.return_value = make_git_result(stdout="abc123 commit message\n")
 
         path = Path("/tmp/repo")
-        result = git_log(path, oneline=True)
+        result = git_log(path, **kwargs)
 
         assert result.success
-        mock_run.assert_called_once_with(["log", "--oneline"], cwd=path)
+        mock_run.assert_called_once_with(expected_args, cwd=path)
 
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_log_with_paths(self, mock_run):
-        """Test git log for specific paths."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="abc123 commit message\n",
-            stderr="",
-            exit_code=0,
-            duration=0.5,
-            command=["git", "log", "--", "lib/component"],
-        )
-        mock_run.return_value = mock_result
+    def test_git_log_calls_do_not_share_argv(self, mock_run, make_git_result):
+        """Test calls with the same options each get their own argument list."""
+        mock_run.return_value = make_git_result()
 
         path = Path("/tmp/repo")
-        result = git_log(path, paths=["lib/component"])
+        git_log(path, oneline=True, limit=5, paths=["a"])
+        git_log(path, oneline=True, limit=5)
+
+        first, second = (c[0][0] for c in mock_run.call_args_list)
+        assert first == ["log", "--oneline", "-n", "5", "--", "a"]
+        assert second == ["log", "--oneline", "-n", "5"]
 
-        assert result.success
-        args = mock_run.call_args[0][0]
-        assert "--" in args
-        assert "lib/component" in args
 
+class TestGitRevList:
+    """Tests for git_rev_list function."""
+
+    @pytest.mark.parametrize(
+        ("count", "expected_args"),
+        [(False, ["rev-list", "HEAD"]), (True, ["rev-list", "HEAD", "--count"])],
+    )
     @patch("subrepo.git_commands.run_git_command")
-    def test_git_log_with_limit_and_revision(self, mock_run):
-        """Test git log with limit and revision range."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="abc123 commit message\n",
-            stderr="",
-            exit_code=0,
-            duration=0.5,
-            command=["git", "log", "-n", "10", "HEAD~5..HEAD"],
-        )
-        mock_run.return_value = mock_result
+    def test_git_rev_list(self, mock_run, make_git_result, count, expected_args):
+        """Test git rev-list with and without --count."""
+        mock_run.return_value = make_git_result(stdout="5\n")
 
         path = Path("/tmp/repo")
-        result = git_log(path, revision_range="HEAD~5..HEAD", limit=10)
+        result = git_rev_list(path, "HEAD", count=count)
 
         assert result.success
-        args = mock_run.call_args[0][0]
-        assert "-n" in args
-        assert "10" in args
-        assert "HEAD~5..HEAD" in args
+        mock_run.assert_called_once_with(expected_args, cwd=path)
 
 
-class TestGitRevList:
-    """Tests for git_rev_list function."""
+class TestGitParallel:
+    """Tests for run_git_commands_parallel function."""
 
-    @patch("subrepo.git_commands.run_git_command")
-    def test_git_rev_list_basic(self, mock_run):
-        """Test git rev-list with basic revision range."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="abc123\ndef456\n",
-            stderr="",
-            exit_code=0,
-            duration=0.3,
-            command=["git", "rev-list", "HEAD"],
+    @patch("subprocess.run")
+    def test_runs_every_spec_in_order(self, mock_run):
+        """Test each spec is executed once and results keep spec order."""
+        mock_run.side_effect = lambda cmd, **kwargs: MagicMock(
+            returncode=0, stdout=cmd[-1].encode(), stderr=b""
         )
-        mock_run.return_value = mock_result
 
-        path = Path("/tmp/repo")
-        result = git_rev_list(path, "HEAD")
+        specs = [
+            GitCommandSpec(["fetch", f"remote{i}"], cwd=Path(f"/tmp/repo{i}")) for i in range(4)
+        ]
+        results = run_git_commands_parallel(specs, max_workers=4)
 
-        assert result.success
-        mock_run.assert_called_once_with(["rev-list", "HEAD"], cwd=path)
+        assert mock_run.call_count == len(specs)
+        assert [r.stdout for r in results] == ["remote0", "remote1", "remote2", "remote3"]
+        assert {c[0][0][2] for c in mock_run.call_args_list} == {str(s.cwd) for s in specs}
 
-    @patch("subrepo.git_commands.run_git_command")
-    def test_git_rev_list_with_count(self, mock_run):
-        """Test counting commits with git rev-list."""
-        mock_result = GitOperationResult(
-            success=True,
-            stdout="5\n",
-            stderr="",
-            exit_code=0,
-            duration=0.3,
-            command=["git", "rev-list", "HEAD", "--count"],
-        )
-        mock_run.return_value = mock_result
+    @patch("subprocess.run")
+    def test_overlaps_slow_commands(self, mock_run):
+        """Test commands run concurrently rather than one after another."""
 
-        path = Path("/tmp/repo")
-        result = git_rev_list(path, "HEAD", count=True)
+        specs = [GitCommandSpec(["fetch", "origin"], cwd=Path(f"/tmp/repo{i}")) for i in range(4)]
+        # Every command blocks until all of them are running, so serial execution breaks the barrier
+        barrier = threading.Barrier(len(specs), timeout=5)
+
+        def blocking_run(cmd, **kwargs):
+            barrier.wait()
+            return MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+        mock_run.side_effect = blocking_run
+
+        run_git_commands_parallel(specs, max_workers=4)
+
+        assert mock_run.call_count == 4
+        assert not barrier.broken
+
+    @patch("subrepo.git_commands.ThreadPoolExecutor")
+    @patch("subrepo.git_commands._usable_cpu_count", return_value=8)
+    def test_default_pool_size_uses_usable_cpus(self, mock_cpus, mock_executor):
+        """Test the default pool is sized to 3/4 of the CPUs the process may use."""
+        run_git_commands_parallel([])
+
+        mock_cpus.assert_called_once()
+        mock_executor.assert_called_once_with(max_workers=6)
+
+    @patch("subprocess.run")
+    def test_propagates_failure(self, mock_run):
+        """Test a failing command with check=True raises GitCommandError."""
+        mock_run.return_value = MagicMock(returncode=1, stdout=b"", stderr=b"fatal: error")
+
+        with pytest.raises(GitCommandError):
+            run_git_commands_parallel([GitCommandSpec(["fetch", "origin"], cwd=Path("/tmp/r"))])
+
+
+def _mock_async_process(returncode=0, stdout=b"", stderr=b""):
+    """Build a mock asyncio subprocess with the given results."""
+    proc = MagicMock()
+    proc.returncode = returncode
+    proc.communicate = AsyncMock(return_value=(stdout, stderr))
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
+
+class TestRunGitCommandAsync:
+    """Tests for run_git_command_async function."""
+
+    @patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+    def test_success(self, mock_exec):
+        """Test successful async git command execution."""
+        mock_exec.return_value = _mock_async_process(stdout=b"success output")
+
+        result = asyncio.run(run_git_command_async(["status"], cwd=Path("/tmp/repo")))
 
         assert result.success
-        assert "5" in result.stdout
-        args = mock_run.call_args[0][0]
-        assert "rev-list" in args
-        assert "HEAD" in args
-        assert "--count" in args
+        assert result.stdout == "success output"
+        assert result.command == ["git", "status"]
+        assert mock_exec.call_args[0][1:] == ("-C", "/tmp/repo", "status")
+
+    @patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+    def test_failure_with_check(self, mock_exec):
+        """Test async command failure with check=True raises exception."""
+        mock_exec.return_value = _mock_async_process(returncode=1, stderr=b"fatal: error")
+
+        with pytest.raises(GitCommandError) as exc_info:
+            asyncio.run(run_git_command_async(["invalid"]))
+
+        assert exc_info.value.exit_code == 1
+        assert exc_info.value.stderr == "fatal: error"
+
+    @patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+    def test_timeout(self, mock_exec):
+        """Test async command timeout kills the process and raises GitCommandError."""
+        proc = _mock_async_process()
+        proc.communicate = AsyncMock(side_effect=TimeoutError)
+        mock_exec.return_value = proc
+
+        with pytest.raises(GitCommandError, match="timed out"):
+            asyncio.run(run_git_command_async(["fetch"], timeout=30))
+
+        proc.kill.assert_called_once()
+
+    @patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+    def test_gather(self, mock_exec):
+        """Test several commands can be awaited together."""
+        mock_exec.side_effect = [
+            _mock_async_process(stdout=b"one"),
+            _mock_async_process(stdout=b"two"),
+            _mock_async_process(stdout=b"three"),
+        ]
+
+        async def fetch_all():
+            return await asyncio.gather(
+                *(run_git_command_async(["fetch", name]) for name in ("a", "b", "c"))
+            )
+
+        results = asyncio.run(fetch_all())
+
+        assert [r.stdout for r in results] == ["one", "two", "three"]
+        assert mock_exec.call_count == 3
+
+
+class TestGatherGitCommands:
+    """Tests for gather_git_commands function."""
+
+    @patch("subrepo.git_commands.uvloop", None)
+    @patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+    def test_runs_specs_on_default_loop(self, mock_exec):
+        """Test all specs run and results keep spec order without uvloop."""
+        mock_exec.side_effect = [
+            _mock_async_process(stdout=b"one"),
+            _mock_async_process(stdout=b"two"),
+        ]
+
+        specs = [
+            GitCommandSpec(["fetch", "a"], cwd=Path("/tmp/a")),
+            GitCommandSpec(["fetch", "b"], cwd=Path("/tmp/b")),
+        ]
+        results = gather_git_commands(specs)
+
+        assert [r.stdout for r in results] == ["one", "two"]
+        assert mock_exec.call_count == 2
+
+    @patch("subrepo.git_commands.uvloop")
+    @patch("asyncio.run")
+    def test_prefers_uvloop(self, mock_asyncio_run, mock_uvloop):
+        """Test uvloop's loop factory is used when uvloop is installed."""
+        mock_asyncio_run.side_effect = lambda coro, loop_factory: coro.close()
+
+        gather_git_commands([])
+
+        assert mock_asyncio_run.call_args[1]["loop_factory"] is mock_uvloop.new_event_loop
@@ -4,6 +4,8 @@ This module tests the execute_git_push() function that performs the actual
 git push operation with error handling.
 """
 
+import io
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -12,20 +14,41 @@ import pytest
 from subrepo.exceptions import (
     BranchProtectionError,
     NonFastForwardError,
+    PushError,
     RepositoryNotFoundError,
 )
-from subrepo.git_commands import execute_git_push
-from subrepo.models import PushAction, PushResult, PushStatus
+from subrepo.git_commands import AsyncPushExecutor, execute_git_push, execute_git_push_batch
+from subrepo.models import GitOperationResult, PushAction, PushItem, PushResult, PushStatus
+
+_PLATFORM_CORE_PATH = Path("platform/core")
+
+
+def _runner(returncode: int = 0, stdout: str = "", stderr: str = "") -> MagicMock:
+    """Build a stand-in for subprocess.run that returns the given process result."""
+    return MagicMock(
+        return_value=MagicMock(
+            returncode=returncode, stdout=stdout.encode(), stderr=stderr.encode()
+        )
+    )
+
+
+def _popen(*outputs: str, returncode: int = 0) -> MagicMock:
+    """Build a stand-in for subprocess.Popen whose processes print the given outputs."""
+    processes = []
+    for output in outputs:
+        process = MagicMock(stdout=io.StringIO(output), returncode=returncode)
+        process.__enter__.return_value = process
+        processes.append(process)
+    return MagicMock(side_effect=processes)
 
 
 class TestExecuteGitPush:
     """Tests for execute_git_push() function."""
 
-    @patch("subrepo.git_commands.subprocess.run")
-    def test_successful_push_to_new_branch(self, mock_run: MagicMock) -> None:
+    def test_successful_push_to_new_branch(self) -> None:
         """Test successful push that creates a new branch."""
-        # Dry-run succeeds with "new branch" indicator
-        mock_run.return_value = MagicMock(
+        # Push output carries the "new branch" indicator
+        mock_run = _runner(
             returncode=0,
             stdout="",
             stderr="* [new branch]      feature -> feature",
@@ -33,10 +56,11 @@ class TestExecuteGitPush:
 
         result = execute_git_push(
             component_name="platform/core",
-            component_path=Path("platform/core"),
+            component_path=_PLATFORM_CORE_PATH,
             remote_url="git@github.com:org/core.git",
             branch_name="feature",
             force=False,
+            runner=mock_run,
         )
 
         assert result.status == PushStatus.SUCCESS
@@ -45,11 +69,10 @@ class TestExecuteGitPush:
         assert result.project_name == "platform/core"
         assert result.error_message is None
 
-    @patch("subrepo.git_commands.subprocess.run")
-    def test_successful_push_to_existing_branch(self, mock_run: MagicMock) -> None:
+    def test_successful_push_to_existing_branch(self) -> None:
         """Test successful push that updates existing branch."""
-        # Dry-run succeeds without "new branch" indicator
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="feature -> feature")
+        # Push output has no "new branch" indicator
+        mock_run = _runner(returncode=0, stdout="", stderr="feature -> feature")
 
         result = execute_git_push(
             component_name="platform/auth",
@@ -57,73 +80,67 @@ class TestExecuteGitPush:
             remote_url="git@github.com:org/auth.git",
             branch_name="feature",
             force=False,
+            runner=mock_run,
         )
 
         assert result.status == PushStatus.SUCCESS
         assert result.action == PushAction.UPDATED
         assert result.branch_name == "feature"
 
-    @patch("subrepo.git_commands.subprocess.run")
-    def test_non_fast_forward_without_force(self, mock_run: MagicMock) -> None:
+    def test_non_fast_forward_without_force(self) -> None:
         """Test that non-fast-forward raises error when force=False."""
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="", stderr="[rejected] non-fast-forward"
-        )
+        mock_run = _runner(returncode=1, stdout="", stderr="[rejected] non-fast-forward")
 
         with pytest.raises(NonFastForwardError) as exc_info:
             execute_git_push(
                 component_name="platform/core",
-                component_path=Path("platform/core"),
+                component_path=_PLATFORM_CORE_PATH,
                 remote_url="git@github.com:org/core.git",
                 branch_name="feature",
                 force=False,
+                runner=mock_run,
             )
 
         assert "feature" in str(exc_info.value)
         assert "platform/core" in str(exc_info.value)
 
-    @patch("subrepo.git_commands.subprocess.run")
-    def test_force_push_succeeds(self, mock_run: MagicMock) -> None:
+    def test_force_push_succeeds(self) -> None:
         """Test that force push succeeds even with non-fast-forward."""
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout="", stderr="+ feature...feature (forced update)"
-        )
+        mock_run = _runner(returncode=0, stdout="", stderr="+ feature...feature (forced update)")
 
         result = execute_git_push(
             component_name="platform/core",
-            component_path=Path("platform/core"),
+            component_path=_PLATFORM_CORE_PATH,
             remote_url="git@github.com:org/core.git",
             branch_name="feature",
             force=True,
+            runner=mock_run,
         )
 
         assert result.status == PushStatus.SUCCESS
         # Verify --force was used
         assert "--force" in mock_run.call_args[0][0]
 
-    @patch("subrepo.git_commands.subprocess.run")
-    def test_protected_branch_raises_error(self, mock_run: MagicMock) -> None:
+    def test_protected_branch_raises_error(self) -> None:
         """Test that protected branch raises specific error."""
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="", stderr="protected branch hook declined"
-        )
+        mock_run = _runner(returncode=1, stdout="", stderr="protected branch hook declined")
 
         with pytest.raises(BranchProtectionError) as exc_info:
             execute_git_push(
                 component_name="platform/core",
-                component_path=Path("platform/core"),
+                component_path=_PLATFORM_CORE_PATH,
                 remote_url="git@github.com:org/core.git",
                 branch_name="main",
                 force=False,
+                runner=mock_run,
             )
 
         assert "main" in str(exc_info.value)
         assert "protected" in str(exc_info.value).lower()
 
-    @patch("subrepo.git_commands.subprocess.run")
-    def test_missing_repository_raises_error(self, mock_run: MagicMock) -> None:
+    def test_missing_repository_raises_error(self) -> None:
         """Test that missing repository raises specific error."""
-        mock_run.return_value = MagicMock(
+        mock_run = _runner(
             returncode=128,
             stdout="",
             stderr="fatal: repository 'git@github.com:org/missing.git' not found",
@@ -136,24 +153,265 @@ class TestExecuteGitPush:
                 remote_url="git@github.com:org/missing.git",
                 branch_name="feature",
                 force=False,
+                runner=mock_run,
             )
 
         assert "missing" in str(exc_info.value).lower()
 
-    @patch("subrepo.git_commands.subprocess.run")
-    def test_uses_subtree_push(self, mock_run: MagicMock) -> None:
+    @pytest.mark.parametrize(
+        ("stderr", "expected_error"),
+        [
+            ("ERROR: Permission denied to org/core.git", BranchProtectionError),
+            ("remote: Repository not found.\nfatal: unable to access", RepositoryNotFoundError),
+            ("not found: repository moved", RepositoryNotFoundError),
+            (" ! [rejected]        main -> main (fetch first)", NonFastForwardError),
+            # Protection takes precedence over rejection when both are reported
+            (
+                "! [remote rejected] main (protected branch hook declined)\n[rejected]",
+                BranchProtectionError,
+            ),
+            ("fatal: unable to access remote", PushError),
+        ],
+    )
+    def test_classifies_failure(self, stderr: str, expected_error: type[PushError]) -> None:
+        """Test push failures map to the most specific error type."""
+        mock_run = _runner(returncode=1, stdout="", stderr=stderr)
+
+        with pytest.raises(PushError) as exc_info:
+            execute_git_push(
+                component_name="platform/core",
+                component_path=_PLATFORM_CORE_PATH,
+                remote_url="git@github.com:org/core.git",
+                branch_name="main",
+                runner=mock_run,
+            )
+
+        assert type(exc_info.value) is expected_error
+
+    def test_uses_subtree_push(self) -> None:
         """Test that git subtree push command is used."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run = _runner(returncode=0, stdout="", stderr="")
 
         execute_git_push(
             component_name="platform/core",
-            component_path=Path("platform/core"),
+            component_path=_PLATFORM_CORE_PATH,
             remote_url="git@github.com:org/core.git",
             branch_name="feature",
             force=False,
+            runner=mock_run,
         )
 
         args = mock_run.call_args[0][0]
-        assert "git" in args
+        assert Path(args[0]).name == "git"
         assert "subtree" in args
         assert "push" in args
+        assert args[1:5] == ("-c", "pack.useBitmaps=false", "-c", "core.warnAmbiguousRefs=false")
+
+    def test_accepts_string_component_path(self) -> None:
+        """Test that a plain string prefix builds the same command as a Path."""
+        mock_run = _runner()
+
+        execute_git_push(
+            component_name="platform/core",
+            component_path="platform/core",
+            remote_url="git@github.com:org/core.git",
+            branch_name="feature",
+            runner=mock_run,
+        )
+
+        assert "--prefix=platform/core" in mock_run.call_args[0][0]
+
+    @patch("subrepo.git_commands.subprocess.run")
+    def test_defaults_to_subprocess_run(self, mock_run: MagicMock) -> None:
+        """Test that subprocess.run executes the push when no runner is given."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+        result = execute_git_push(
+            component_name="platform/core",
+            component_path=_PLATFORM_CORE_PATH,
+            remote_url="git@github.com:org/core.git",
+            branch_name="feature",
+        )
+
+        assert result.status == PushStatus.SUCCESS
+        assert "subtree" in mock_run.call_args[0][0]
+        assert mock_run.call_args.kwargs["close_fds"] is False
+
+
+@pytest.fixture
+def mock_split(make_git_result):
+    """Patch subtree splitting to return a fake commit per spec, named after the prefix."""
+
+    def split(specs: list) -> list[GitOperationResult]:
+        return [
+            make_git_result(
+                stdout=f"sha-{spec.args[2].removeprefix('--prefix=')}\n",
+                command=["git", *spec.args],
+            )
+            for spec in specs
+        ]
+
+    with patch("subrepo.git_commands.run_git_commands_parallel", side_effect=split) as mock:
+        yield mock
+
+
+class TestExecuteGitPushBatch:
+    """Tests for execute_git_push_batch() function."""
+
+    def test_one_push_per_remote(self, mock_split: MagicMock) -> None:
+        """Test components sharing a remote are pushed with one command."""
+        popen = _popen(
+            "To git@github.com:org/core.git\n"
+            "*\tsha-a:refs/heads/feature\t[new branch]\n"
+            " \tsha-b:refs/heads/main\t111..222\n"
+            "Done\n"
+        )
+        items = [
+            PushItem("a", Path("a"), "git@github.com:org/core.git", "feature"),
+            PushItem("b", Path("b"), "git@github.com:org/core.git", "main", force=True),
+        ]
+
+        results = execute_git_push_batch(items, popen=popen)
+
+        popen.assert_called_once()
+        args = popen.call_args[0][0]
+        assert args[1:] == [
+            "-c",
+            "pack.useBitmaps=false",
+            "-c",
+            "core.warnAmbiguousRefs=false",
+            "push",
+            "--porcelain",
+            "--thin",
+            "--no-atomic",
+            "git@github.com:org/core.git",
+            "sha-a:refs/heads/feature",
+            "+sha-b:refs/heads/main",
+        ]
+        assert [r.action for r in results] == [PushAction.CREATED, PushAction.UPDATED]
+        assert all(r.status == PushStatus.SUCCESS for r in results)
+        assert len(mock_split.call_args[0][0]) == 2
+
+    def test_results_follow_item_order_across_remotes(self, mock_split: MagicMock) -> None:
+        """Test each remote gets its own push and results keep item order."""
+        popen = _popen(
+            "*\tsha-a:refs/heads/main\t[new branch]\n*\tsha-c:refs/heads/release\t[new branch]\n",
+            "=\tsha-b:refs/heads/main\t[up to date]\n",
+        )
+        items = [
+            PushItem("a", Path("a"), "git@github.com:org/a.git", "main"),
+            PushItem("b", Path("b"), "git@github.com:org/b.git", "main"),
+            PushItem("c", Path("c"), "git@github.com:org/a.git", "release"),
+        ]
+
+        results = execute_git_push_batch(items, popen=popen)
+
+        assert popen.call_count == 2
+        assert [r.project_name for r in results] == ["a", "b", "c"]
+        assert [r.action for r in results] == [
+            PushAction.CREATED,
+            PushAction.UPDATED,
+            PushAction.CREATED,
+        ]
+
+    def test_rejected_ref_fails_only_its_component(self, mock_split: MagicMock) -> None:
+        """Test a rejected ref is reported as failed while others succeed."""
+        popen = _popen(
+            "!\tsha-a:refs/heads/main\t[rejected] (non-fast-forward)\n"
+            " \tsha-b:refs/heads/dev\t111..222\n"
+            "error: failed to push some refs\n",
+            returncode=1,
+        )
+        items = [
+            PushItem("a", Path("a"), "git@github.com:org/core.git", "main"),
+            PushItem("b", Path("b"), "git@github.com:org/core.git", "dev"),
+        ]
+
+        failed, pushed = execute_git_push_batch(items, popen=popen)
+
+        assert failed.status == PushStatus.FAILED
+        assert failed.action == PushAction.SKIPPED
+        assert "non-fast-forward" in failed.error_message
+        assert pushed.status == PushStatus.SUCCESS
+
+    def test_unreachable_remote_fails_its_components(self, mock_split: MagicMock) -> None:
+        """Test a push with no per-ref status reports git's output for every component."""
+        popen = _popen(
+            "ERROR: Repository not found.\nfatal: Could not read from remote\n", returncode=128
+        )
+        items = [PushItem("a", Path("a"), "git@github.com:org/gone.git", "main")]
+
+        (result,) = execute_git_push_batch(items, popen=popen)
+
+        assert result.status == PushStatus.FAILED
+        assert "does not exist" in result.error_message
+
+    def test_silent_failed_exit_fails_unreported_refs(self, mock_split: MagicMock) -> None:
+        """Test refs without a status line fail with the exit status when git printed nothing."""
+        popen = _popen("*\tsha-a:refs/heads/main\t[new branch]\n", returncode=-9)
+        items = [
+            PushItem("a", Path("a"), "git@github.com:org/core.git", "main"),
+            PushItem("b", Path("b"), "git@github.com:org/core.git", "dev"),
+        ]
+
+        pushed, failed = execute_git_push_batch(items, popen=popen)
+
+        assert pushed.status == PushStatus.SUCCESS
+        assert failed.status == PushStatus.FAILED
+        assert "exited with status -9" in failed.error_message
+
+    def test_same_branch_twice_on_one_remote(self, mock_split: MagicMock) -> None:
+        """Test every component targeting a reported ref receives its status."""
+        popen = _popen("!\tsha-b:refs/heads/main\t[rejected] (fetch first)\n", returncode=1)
+        items = [
+            PushItem("a", Path("a"), "git@github.com:org/core.git", "main"),
+            PushItem("b", Path("b"), "git@github.com:org/core.git", "main"),
+        ]
+
+        results = execute_git_push_batch(items, popen=popen)
+
+        assert [r.status for r in results] == [PushStatus.FAILED, PushStatus.FAILED]
+
+    def test_empty_batch_runs_nothing(self, mock_split: MagicMock) -> None:
+        """Test no git process is started for an empty batch."""
+        popen = MagicMock()
+
+        assert execute_git_push_batch([], popen=popen) == []
+        popen.assert_not_called()
+        mock_split.assert_not_called()
+
+
+class TestAsyncPushExecutor:
+    """Tests for AsyncPushExecutor."""
+
+    def test_pushes_run_concurrently(self) -> None:
+        """Test submitted pushes overlap and each future yields its result."""
+
+        items = [
+            PushItem(f"c{i}", Path(f"c{i}"), f"git@github.com:org/c{i}.git", "feature")
+            for i in range(4)
+        ]
+        # Every push blocks until all of them are in flight, so a serial executor breaks the barrier
+        barrier = threading.Barrier(len(items), timeout=5)
+
+        def blocking_push(cmd: list[str], **kwargs: object) -> MagicMock:
+            barrier.wait()
+            return MagicMock(returncode=0, stdout=b"", stderr=b"* [new branch]")
+
+        with AsyncPushExecutor(max_workers=4, runner=blocking_push) as executor:
+            futures = [executor.submit(item) for item in items]
+            results = [future.result() for future in futures]
+
+        assert [r.project_name for r in results] == ["c0", "c1", "c2", "c3"]
+        assert all(r.action == PushAction.CREATED for r in results)
+        assert not barrier.broken
+
+    def test_failed_push_raises_from_future(self) -> None:
+        """Test a push error surfaces when the future's result is read."""
+        item = PushItem("platform/core", _PLATFORM_CORE_PATH, "git@github.com:org/core.git", "main")
+
+        with AsyncPushExecutor(max_workers=1, runner=_runner(1, stderr="[rejected]")) as executor:
+            future = executor.submit(item)
+
+        with pytest.raises(NonFastForwardError):
+            future.result()
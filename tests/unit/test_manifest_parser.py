@@ -4,68 +4,87 @@ Tests XML parsing and manifest validation functions.
 Per TDD: These tests MUST fail until implementation is complete.
 """
 
-import tempfile
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from subrepo.exceptions import ManifestError, ManifestValidationError
+from subrepo.manifest_parser import (
+    extract_default_branch_from_project,
+    is_commit_sha,
+    parse_manifest,
+    parse_manifests,
+)
+from subrepo.models import Project
+
+_ORIGIN = '<remote name="origin" fetch="https://github.com/" />'
+_DEFAULT = '<default remote="origin" revision="main" />'
+_PROJECT_LIB = '<project name="org/lib" path="lib" />'
+
+
+def _manifest_xml(*elements: str) -> str:
+    """Build a manifest document containing the given top-level elements."""
+    body = "".join(f"  {element}\n" for element in elements)
+    return f'<?xml version="1.0" encoding="UTF-8"?>\n<manifest>\n{body}</manifest>\n'
+
+
+def _write_manifest(tmp_path: Path, xml: str) -> Path:
+    """Write a manifest document to a file in tmp_path and return its path."""
+    manifest_path = tmp_path / "manifest.xml"
+    manifest_path.write_text(xml)
+    return manifest_path
+
 
 class TestXMLParsingLogic:
     """Tests for XML parsing functionality."""
 
-    def test_parse_simple_manifest_xml(self):
+    def test_parse_simple_manifest_xml(self, tmp_path):
         """Test parsing a simple manifest XML with one remote and one project.
 
         This test will FAIL until parse_manifest is implemented.
         """
-        from subrepo.manifest_parser import parse_manifest
-
         # Create test manifest
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
+        manifest_path = _write_manifest(
+            tmp_path,
+            """<?xml version="1.0" encoding="UTF-8"?>
 <manifest>
   <remote name="origin" fetch="https://github.com/" />
   <default remote="origin" revision="main" />
   <project name="org/repo" path="lib/repo" />
 </manifest>
-"""
-            )
-            manifest_path = Path(f.name)
-
-        try:
-            manifest = parse_manifest(manifest_path)
-
-            # Assert remote parsed correctly
-            assert len(manifest.remotes) == 1
-            assert "origin" in manifest.remotes
-            assert manifest.remotes["origin"].name == "origin"
-            assert manifest.remotes["origin"].fetch == "https://github.com/"
-
-            # Assert default parsed correctly
-            assert manifest.default_remote == "origin"
-            assert manifest.default_revision == "main"
-
-            # Assert project parsed correctly
-            assert len(manifest.projects) == 1
-            project = manifest.projects[0]
-            assert project.name == "org/repo"
-            assert project.path == "lib/repo"
-            assert project.remote == "origin"
-            assert project.revision == "main"  # Should use default
-        finally:
-            manifest_path.unlink()
-
-    def test_parse_manifest_with_multiple_remotes(self):
+""",
+        )
+
+        manifest = parse_manifest(manifest_path)
+
+        # Assert remote parsed correctly
+        assert len(manifest.remotes) == 1
+        assert "origin" in manifest.remotes
+        assert manifest.remotes["origin"].name == "origin"
+        assert manifest.remotes["origin"].fetch == "https://github.com/"
+
+        # Assert default parsed correctly
+        assert manifest.default_remote == "origin"
+        assert manifest.default_revision == "main"
+
+        # Assert project parsed correctly
+        assert len(manifest.projects) == 1
+        project = manifest.projects[0]
+        assert project.name == "org/repo"
+        assert project.path == "lib/repo"
+        assert project.remote == "origin"
+        assert project.revision == "main"  # Should use default
+
+    def test_parse_manifest_with_multiple_remotes(self, tmp_path):
         """Test parsing manifest with multiple remotes.
 
         This test will FAIL until parse_manifest is implemented.
         """
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
+        manifest_path = _write_manifest(
+            tmp_path,
+            """<?xml version="1.0" encoding="UTF-8"?>
 <manifest>
   <remote name="github" fetch="https://github.com/" />
   <remote name="gitlab" fetch="https://gitlab.com/" />
@@ -73,364 +92,360 @@ class TestXMLParsingLogic:
   <project name="org/repo1" path="lib/repo1" />
   <project name="org/repo2" path="lib/repo2" remote="gitlab" />
 </manifest>
-"""
-            )
-            manifest_path = Path(f.name)
+""",
+        )
 
-        try:
-            manifest = parse_manifest(manifest_path)
+        manifest = parse_manifest(manifest_path)
 
-            assert len(manifest.remotes) == 2
-            assert "github" in manifest.remotes
-            assert "gitlab" in manifest.remotes
+        assert len(manifest.remotes) == 2
+        assert "github" in manifest.remotes
+        assert "gitlab" in manifest.remotes
 
-            # First project uses default remote
-            assert manifest.projects[0].remote == "github"
+        # First project uses default remote
+        assert manifest.projects[0].remote == "github"
 
-            # Second project explicitly uses gitlab
-            assert manifest.projects[1].remote == "gitlab"
-        finally:
-            manifest_path.unlink()
+        # Second project explicitly uses gitlab
+        assert manifest.projects[1].remote == "gitlab"
 
-    def test_parse_manifest_with_explicit_revisions(self):
+    def test_parse_manifest_with_explicit_revisions(self, tmp_path):
         """Test parsing manifest where projects specify explicit revisions.
 
         This test will FAIL until parse_manifest is implemented.
         """
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
+        manifest_path = _write_manifest(
+            tmp_path,
+            """<?xml version="1.0" encoding="UTF-8"?>
 <manifest>
   <remote name="origin" fetch="https://github.com/" />
   <default remote="origin" revision="main" />
   <project name="org/repo1" path="lib/repo1" revision="v1.0.0" />
   <project name="org/repo2" path="lib/repo2" revision="develop" />
 </manifest>
-"""
-            )
-            manifest_path = Path(f.name)
+""",
+        )
 
-        try:
-            manifest = parse_manifest(manifest_path)
+        manifest = parse_manifest(manifest_path)
 
-            # Projects should use their explicit revisions
-            assert manifest.projects[0].revision == "v1.0.0"
-            assert manifest.projects[1].revision == "develop"
-        finally:
-            manifest_path.unlink()
+        # Projects should use their explicit revisions
+        assert manifest.projects[0].revision == "v1.0.0"
+        assert manifest.projects[1].revision == "develop"
+
+    def test_repeated_remote_and_revision_share_one_string(self):
+        """Test that projects naming the same remote and revision share the strings."""
+        manifest = parse_manifest(
+            b"""<manifest>
+  <remote name="origin" fetch="https://github.com/" />
+  <project name="org/a" path="a" remote="origin" revision="release-1.0" />
+  <project name="org/b" path="b" remote="origin" revision="release-1.0" />
+</manifest>"""
+        )
 
-    def test_parse_malformed_xml_raises_error(self):
+        first, second = manifest.projects
+        assert first.remote is second.remote is next(iter(manifest.remotes))
+        assert first.revision is second.revision
+
+    def test_parse_malformed_xml_raises_error(self, tmp_path):
         """Test that malformed XML raises a parsing error.
 
         This test will FAIL until parse_manifest is implemented.
         """
-        from subrepo.exceptions import ManifestError
-        from subrepo.manifest_parser import parse_manifest
+        manifest_path = _write_manifest(tmp_path, "<manifest><unclosed>")
+
+        with pytest.raises(ManifestError):
+            parse_manifest(manifest_path)
+
+    def test_wrong_root_element_rejected_before_rest_of_document(self, tmp_path):
+        """Test that the root tag is checked before the remaining XML is parsed."""
+        manifest_path = _write_manifest(tmp_path, "<wrongroot>\n  <remote <<< not xml")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write("<manifest><unclosed>")
-            manifest_path = Path(f.name)
+        with pytest.raises(ManifestError) as exc_info:
+            parse_manifest(manifest_path)
 
-        try:
-            with pytest.raises(ManifestError):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
+        assert "got <wrongroot>" in str(exc_info.value)
+
+    def test_parse_malformed_xml_bytes_raises_error(self):
+        """Test that a malformed in-memory document raises a parsing error."""
+        with pytest.raises(ManifestError) as exc_info:
+            parse_manifest(b"<manifest><unclosed>")
+
+        assert "Failed to parse manifest XML" in str(exc_info.value)
 
     def test_parse_nonexistent_file_raises_error(self):
         """Test that parsing a non-existent file raises an error.
 
         This test will FAIL until parse_manifest is implemented.
         """
-        from subrepo.exceptions import ManifestError
-        from subrepo.manifest_parser import parse_manifest
-
         with pytest.raises(ManifestError):
             parse_manifest(Path("/nonexistent/manifest.xml"))
 
+    @pytest.mark.parametrize(
+        ("content", "raises"),
+        [
+            (
+                """<manifest>
+  <!-- comments are not elements -->
+  <remote name="origin" fetch="https://github.com/" />
+  <default remote="origin" revision="main" />
+  <project name="org/lib" path="lib" />
+</manifest>""",
+                False,
+            ),
+            ("<manifest><unclosed>", True),
+        ],
+        ids=["valid", "malformed"],
+    )
+    def test_parses_without_lxml(self, tmp_path, content, raises):
+        """Test that ElementTree is used when lxml is not installed."""
+        manifest_path = tmp_path / "manifest.xml"
+        manifest_path.write_text(content)
+
+        with patch("subrepo.manifest_parser._USE_LXML", False):
+            if raises:
+                with pytest.raises(ManifestError):
+                    parse_manifest(manifest_path)
+            else:
+                manifest = parse_manifest(manifest_path)
+                assert [project.path for project in manifest.projects] == ["lib"]
+
+    def test_default_after_projects_applies_to_them(self, tmp_path):
+        """Test that top-level elements take effect regardless of document order."""
+        manifest_path = tmp_path / "manifest.xml"
+        manifest_path.write_text(
+            """<manifest>
+  <project name="org/lib" path="lib">
+    <copyfile src="a" dest="b" />
+  </project>
+  <default remote="origin" revision="develop" />
+  <remote name="origin" fetch="https://github.com/" />
+</manifest>"""
+        )
 
-class TestManifestValidationRules:
-    """Tests for manifest validation logic."""
+        manifest = parse_manifest(manifest_path)
 
-    def test_validate_manifest_with_no_remotes_fails(self):
-        """Test that validation fails when manifest has no remotes.
+        (project,) = manifest.projects
+        assert (project.remote, project.revision) == ("origin", "develop")
+        assert [(c.src, c.dest) for c in project.copyfiles] == [("a", "b")]
 
-        Parse fails early when project has no remote and no default.
-        """
-        from subrepo.exceptions import ManifestError
-        from subrepo.manifest_parser import parse_manifest
+    def test_syntax_error_reported_before_missing_attributes(self, tmp_path):
+        """Test that a malformed document fails as a parse error, not a validation one."""
+        manifest_path = tmp_path / "manifest.xml"
+        manifest_path.write_text('<manifest>\n  <remote fetch="x" />\n  <project')
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <project name="org/repo" path="lib/repo" />
-</manifest>
-"""
-            )
-            manifest_path = Path(f.name)
-
-        try:
-            with pytest.raises(ManifestError, match="has no remote specified"):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
+        with pytest.raises(ManifestError) as exc_info:
+            parse_manifest(manifest_path)
 
-    def test_validate_manifest_with_no_projects_fails(self):
-        """Test that validation fails when manifest has no projects.
+        assert "Failed to parse manifest XML" in str(exc_info.value)
 
-        Model validation catches this in __post_init__.
-        """
-        from subrepo.exceptions import ManifestValidationError
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <remote name="origin" fetch="https://github.com/" />
-</manifest>
-"""
-            )
-            manifest_path = Path(f.name)
+    def test_rewrite_with_same_size_and_mtime_is_reparsed(self, tmp_path):
+        """Test that a rewrite is seen even when size and modification time are unchanged."""
+        manifest_path = tmp_path / "manifest.xml"
+        template = _manifest_xml(
+            _ORIGIN, '<default remote="origin" revision="{revision}" />', _PROJECT_LIB
+        )
+        manifest_path.write_text(template.format(revision="main"))
+        stat = manifest_path.stat()
+        first = parse_manifest(manifest_path)
 
-        try:
-            # Model __post_init__ catches empty projects and raises ManifestValidationError
-            with pytest.raises(ManifestValidationError):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
+        manifest_path.write_text(template.format(revision="dev1"))
+        os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        second = parse_manifest(manifest_path)
 
-    def test_validate_manifest_with_invalid_remote_reference(self):
-        """Test that validation fails when project references non-existent remote.
+        assert first.default_revision == "main"
+        assert second.default_revision == "dev1"
 
-        Model __post_init__ validates remote references.
-        """
-        from subrepo.exceptions import ManifestValidationError
-        from subrepo.manifest_parser import parse_manifest
+    def test_callers_get_independent_manifests(self, tmp_path):
+        """Test that changing one parsed manifest does not affect the next parse."""
+        manifest_path = tmp_path / "manifest.xml"
+        manifest_path.write_text(_manifest_xml(_ORIGIN, _DEFAULT, _PROJECT_LIB))
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <remote name="origin" fetch="https://github.com/" />
-  <project name="org/repo" path="lib/repo" remote="nonexistent" />
-</manifest>
-"""
-            )
-            manifest_path = Path(f.name)
+        first = parse_manifest(manifest_path)
+        first.projects.append(first.projects[0])
+        second = parse_manifest(manifest_path)
 
-        try:
-            with pytest.raises(ManifestValidationError, match="references unknown remote"):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
+        assert second is not first
+        assert [p.path for p in second.projects] == ["lib"]
 
-    def test_validate_manifest_with_duplicate_paths_fails(self):
-        """Test that validation fails when multiple projects use the same path.
 
-        Model __post_init__ validates path uniqueness.
-        """
-        from subrepo.exceptions import ManifestValidationError
-        from subrepo.manifest_parser import parse_manifest
+class TestParseManifests:
+    """Tests for parsing several manifests at once."""
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <remote name="origin" fetch="https://github.com/" />
-  <default remote="origin" revision="main" />
-  <project name="org/repo1" path="lib/repo" />
-  <project name="org/repo2" path="lib/repo" />
-</manifest>
-"""
+    def test_results_follow_path_order(self, tmp_path):
+        """Test each manifest is parsed and returned in the order given."""
+        paths = []
+        for name in ("one", "two", "three"):
+            manifest_path = tmp_path / f"{name}.xml"
+            manifest_path.write_text(
+                _manifest_xml(_ORIGIN, _DEFAULT, f'<project name="org/{name}" path="{name}" />')
             )
-            manifest_path = Path(f.name)
+            paths.append(manifest_path)
 
-        try:
-            with pytest.raises(ManifestValidationError, match="Duplicate"):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
+        manifests = parse_manifests(paths)
 
-    def test_validate_manifest_with_absolute_path_fails(self):
-        """Test that validation fails when project path is absolute.
+        assert [m.projects[0].path for m in manifests] == ["one", "two", "three"]
 
-        This test will FAIL until validate_manifest is implemented.
-        """
-        from subrepo.exceptions import ManifestValidationError
-        from subrepo.manifest_parser import parse_manifest
+    def test_failure_propagates(self, tmp_path):
+        """Test an invalid manifest among several raises its error."""
+        good = tmp_path / "good.xml"
+        good.write_text(_manifest_xml(_ORIGIN, _DEFAULT, '<project name="org/repo" path="repo" />'))
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <remote name="origin" fetch="https://github.com/" />
-  <default remote="origin" revision="main" />
-  <project name="org/repo" path="/absolute/path" />
-</manifest>
-"""
-            )
-            manifest_path = Path(f.name)
+        with pytest.raises(ManifestError) as exc_info:
+            parse_manifests([good, tmp_path / "missing.xml"])
 
-        try:
-            with pytest.raises(ManifestValidationError):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
+        assert "not found" in str(exc_info.value)
 
-    def test_validate_manifest_with_path_parent_reference_fails(self):
-        """Test that validation fails when project path contains '..' components.
+    def test_empty_list(self):
+        """Test no manifests parse to an empty list."""
+        assert parse_manifests([]) == []
 
-        This ensures projects can't escape the workspace directory.
-        """
-        from subrepo.exceptions import ManifestValidationError
-        from subrepo.manifest_parser import parse_manifest
+    @patch("subrepo.manifest_parser.ThreadPoolExecutor")
+    @patch("subrepo.manifest_parser._usable_cpu_count", return_value=2)
+    def test_pool_is_capped_at_usable_cpus(self, mock_cpus, mock_executor, tmp_path):
+        """Test the pool is sized like the git command pool, from the CPUs the process may use."""
+        parse_manifests([tmp_path / "one.xml", tmp_path / "two.xml", tmp_path / "three.xml"])
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <remote name="origin" fetch="https://github.com/" />
-  <default remote="origin" revision="main" />
-  <project name="org/repo" path="../outside" />
-</manifest>
-"""
-            )
-            manifest_path = Path(f.name)
-
-        try:
-            with pytest.raises(ManifestValidationError):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
-
-    def test_parse_manifest_missing_project_name(self):
-        """Test that parsing fails when project is missing name attribute."""
-        from subrepo.exceptions import ManifestError
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <remote name="origin" fetch="https://github.com/" />
-  <project path="lib/repo" />
-</manifest>
-"""
-            )
-            manifest_path = Path(f.name)
-
-        try:
-            with pytest.raises(ManifestError, match="missing required 'name' attribute"):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
-
-    def test_parse_manifest_missing_project_path(self):
-        """Test that parsing fails when project is missing path attribute."""
-        from subrepo.exceptions import ManifestError
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <remote name="origin" fetch="https://github.com/" />
-  <project name="org/repo" />
-</manifest>
-"""
-            )
-            manifest_path = Path(f.name)
-
-        try:
-            with pytest.raises(ManifestError, match="missing required 'path' attribute"):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
-
-    def test_parse_manifest_missing_remote_name(self):
-        """Test that parsing fails when remote is missing name attribute."""
-        from subrepo.exceptions import ManifestError
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <remote fetch="https://github.com/" />
-  <project name="org/repo" path="lib/repo" />
-</manifest>
-"""
-            )
-            manifest_path = Path(f.name)
-
-        try:
-            with pytest.raises(ManifestError, match="missing required 'name' attribute"):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
-
-    def test_parse_manifest_missing_remote_fetch(self):
-        """Test that parsing fails when remote is missing fetch attribute."""
-        from subrepo.exceptions import ManifestError
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <remote name="origin" />
-  <project name="org/repo" path="lib/repo" />
-</manifest>
-"""
-            )
-            manifest_path = Path(f.name)
+        mock_cpus.assert_called_once()
+        mock_executor.assert_called_once_with(max_workers=2)
 
-        try:
-            with pytest.raises(ManifestError, match="missing required 'fetch' attribute"):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
 
-    def test_parse_manifest_with_optional_attributes(self):
-        """Test parsing manifest with optional remote and project attributes."""
-        from subrepo.manifest_parser import parse_manifest
+class TestManifestValidationRules:
+    """Tests for manifest validation logic."""
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
+    @pytest.mark.parametrize(
+        ("xml", "error", "message"),
+        [
+            pytest.param(
+                _manifest_xml('<project name="org/repo" path="lib/repo" />'),
+                ManifestError,
+                "has no remote specified",
+                id="no-remotes",
+            ),
+            pytest.param(
+                _manifest_xml(_ORIGIN),
+                ManifestValidationError,
+                "at least one project",
+                id="no-projects",
+            ),
+            pytest.param(
+                _manifest_xml(
+                    _ORIGIN, '<project name="org/repo" path="lib/repo" remote="nonexistent" />'
+                ),
+                ManifestValidationError,
+                "references unknown remote",
+                id="unknown-remote",
+            ),
+            pytest.param(
+                _manifest_xml(
+                    _ORIGIN,
+                    _DEFAULT,
+                    '<project name="org/repo1" path="lib/repo" />',
+                    '<project name="org/repo2" path="lib/repo" />',
+                ),
+                ManifestValidationError,
+                "Duplicate",
+                id="duplicate-paths",
+            ),
+            pytest.param(
+                _manifest_xml(
+                    _ORIGIN, _DEFAULT, '<project name="org/repo" path="/absolute/path" />'
+                ),
+                ManifestValidationError,
+                "must be relative",
+                id="absolute-path",
+            ),
+            pytest.param(
+                _manifest_xml(_ORIGIN, _DEFAULT, '<project name="org/repo" path="../outside" />'),
+                ManifestValidationError,
+                "cannot contain '..' components",
+                id="parent-reference",
+            ),
+            pytest.param(
+                _manifest_xml(_ORIGIN, '<project path="lib/repo" />'),
+                ManifestError,
+                "missing required 'name' attribute",
+                id="project-without-name",
+            ),
+            pytest.param(
+                _manifest_xml(_ORIGIN, '<project name="org/repo" />'),
+                ManifestError,
+                "missing required 'path' attribute",
+                id="project-without-path",
+            ),
+            pytest.param(
+                _manifest_xml(
+                    '<remote fetch="https://github.com/" />',
+                    '<project name="org/repo" path="lib/repo" />',
+                ),
+                ManifestError,
+                "missing required 'name' attribute",
+                id="remote-without-name",
+            ),
+            pytest.param(
+                _manifest_xml(
+                    '<remote name="origin" />', '<project name="org/repo" path="lib/repo" />'
+                ),
+                ManifestError,
+                "missing required 'fetch' attribute",
+                id="remote-without-fetch",
+            ),
+            pytest.param(
+                _manifest_xml(_ORIGIN, '<project name="org/repo" path="lib/repo" />'),
+                ManifestError,
+                "has no remote specified",
+                id="no-default-remote",
+            ),
+            pytest.param(
+                _manifest_xml(
+                    _ORIGIN,
+                    '<default remote="nonexistent" revision="main" />',
+                    '<project name="org/repo" path="lib/repo" remote="origin" />',
+                ),
+                ManifestValidationError,
+                "Default remote",
+                id="unknown-default-remote",
+            ),
+            pytest.param(
+                f"<wrongroot>\n  {_ORIGIN}\n</wrongroot>\n",
+                ManifestError,
+                "Expected <manifest> root element",
+                id="wrong-root-element",
+            ),
+        ],
+    )
+    def test_invalid_manifest_raises(self, tmp_path, xml, error, message):
+        """Test that parsing an invalid manifest raises the matching error."""
+        with pytest.raises(error) as exc_info:
+            parse_manifest(_write_manifest(tmp_path, xml))
+
+        assert message in str(exc_info.value)
+
+    def test_parse_manifest_with_optional_attributes(self, tmp_path):
+        """Test parsing manifest with optional remote and project attributes."""
+        manifest_path = _write_manifest(
+            tmp_path,
+            """<?xml version="1.0" encoding="UTF-8"?>
 <manifest>
   <remote name="origin" fetch="https://github.com/" push="https://github.com/push" review="https://review.com" />
   <default remote="origin" revision="main" />
   <project name="org/repo" path="lib/repo" upstream="upstream-branch" clone-depth="1" />
 </manifest>
-"""
-            )
-            manifest_path = Path(f.name)
+""",
+        )
 
-        try:
-            manifest = parse_manifest(manifest_path)
+        manifest = parse_manifest(manifest_path)
 
-            # Check remote optional attributes
-            assert manifest.remotes["origin"].push_url == "https://github.com/push"
-            assert manifest.remotes["origin"].review == "https://review.com"
+        # Check remote optional attributes
+        assert manifest.remotes["origin"].push_url == "https://github.com/push"
+        assert manifest.remotes["origin"].review == "https://review.com"
 
-            # Check project optional attributes
-            assert manifest.projects[0].upstream == "upstream-branch"
-            assert manifest.projects[0].clone_depth == 1
-        finally:
-            manifest_path.unlink()
+        # Check project optional attributes
+        assert manifest.projects[0].upstream == "upstream-branch"
+        assert manifest.projects[0].clone_depth == 1
 
-    def test_parse_manifest_with_notice(self):
+    def test_parse_manifest_with_notice(self, tmp_path):
         """Test parsing manifest with notice element."""
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
+        manifest_path = _write_manifest(
+            tmp_path,
+            """<?xml version="1.0" encoding="UTF-8"?>
 <manifest>
   <remote name="origin" fetch="https://github.com/" />
   <default remote="origin" revision="main" />
@@ -440,87 +455,15 @@ class TestManifestValidationRules:
     It can span multiple lines.
   </notice>
 </manifest>
-"""
-            )
-            manifest_path = Path(f.name)
-
-        try:
-            manifest = parse_manifest(manifest_path)
-            assert manifest.notice is not None
-            assert "This is a notice message" in manifest.notice
-        finally:
-            manifest_path.unlink()
-
-    def test_parse_manifest_project_with_no_default_remote(self):
-        """Test that parsing fails when project has no remote and no default remote."""
-        from subrepo.exceptions import ManifestError
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <remote name="origin" fetch="https://github.com/" />
-  <project name="org/repo" path="lib/repo" />
-</manifest>
-"""
-            )
-            manifest_path = Path(f.name)
-
-        try:
-            with pytest.raises(ManifestError, match="has no remote specified"):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
-
-    def test_validate_manifest_invalid_default_remote(self):
-        """Test that validation fails when default remote doesn't exist."""
-        from subrepo.exceptions import ManifestValidationError
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<manifest>
-  <remote name="origin" fetch="https://github.com/" />
-  <default remote="nonexistent" revision="main" />
-  <project name="org/repo" path="lib/repo" remote="origin" />
-</manifest>
-"""
-            )
-            manifest_path = Path(f.name)
-
-        try:
-            with pytest.raises(ManifestValidationError, match="Default remote"):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
-
-    def test_parse_manifest_wrong_root_element(self):
-        """Test that parsing fails when root element is not <manifest>."""
-        from subrepo.exceptions import ManifestError
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
-<wrongroot>
-  <remote name="origin" fetch="https://github.com/" />
-</wrongroot>
-"""
-            )
-            manifest_path = Path(f.name)
+""",
+        )
 
-        try:
-            with pytest.raises(ManifestError, match="Expected <manifest> root element"):
-                parse_manifest(manifest_path)
-        finally:
-            manifest_path.unlink()
+        manifest = parse_manifest(manifest_path)
+        assert manifest.notice is not None
+        assert "This is a notice message" in manifest.notice
 
     def test_is_commit_sha(self):
         """Test the is_commit_sha utility function."""
-        from subrepo.manifest_parser import is_commit_sha
-
         # Valid SHA
         assert is_commit_sha("a" * 40)
         assert is_commit_sha("1234567890abcdef1234567890abcdef12345678")
@@ -534,9 +477,6 @@ class TestManifestValidationRules:
 
     def test_extract_default_branch_from_project(self):
         """Test extracting default branch from project."""
-        from subrepo.manifest_parser import extract_default_branch_from_project
-        from subrepo.models import Project
-
         # Branch name
         project = Project(name="test", path="test", remote="origin", revision="main")
         assert extract_default_branch_from_project(project) == "main"
@@ -555,11 +495,7 @@ class TestCopyfileAndLinkfileParsing:
 
     def test_parse_project_extracts_copyfile_elements(self):
         """Test that parse_project extracts copyfile elements from XML."""
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
+        manifest_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
 <manifest>
   <remote name="origin" fetch="https://github.com/" />
   <default remote="origin" revision="main" />
@@ -568,27 +504,18 @@ class TestCopyfileAndLinkfileParsing:
   </project>
 </manifest>
 """
-            )
-            manifest_path = Path(f.name)
 
-        try:
-            manifest = parse_manifest(manifest_path)
+        manifest = parse_manifest(manifest_xml)
 
-            assert len(manifest.projects) == 1
-            project = manifest.projects[0]
-            assert len(project.copyfiles) == 1
-            assert project.copyfiles[0].src == "docs/README.md"
-            assert project.copyfiles[0].dest == "README.md"
-        finally:
-            manifest_path.unlink()
+        assert len(manifest.projects) == 1
+        project = manifest.projects[0]
+        assert len(project.copyfiles) == 1
+        assert project.copyfiles[0].src == "docs/README.md"
+        assert project.copyfiles[0].dest == "README.md"
 
     def test_parse_project_creates_copyfile_objects_with_correct_src_dest(self):
         """Test that parse_project creates Copyfile objects with correct attributes."""
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
+        manifest_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
 <manifest>
   <remote name="origin" fetch="https://github.com/" />
   <default remote="origin" revision="main" />
@@ -597,25 +524,16 @@ class TestCopyfileAndLinkfileParsing:
   </project>
 </manifest>
 """
-            )
-            manifest_path = Path(f.name)
 
-        try:
-            manifest = parse_manifest(manifest_path)
+        manifest = parse_manifest(manifest_xml)
 
-            copyfile = manifest.projects[0].copyfiles[0]
-            assert copyfile.src == "config/Makefile"
-            assert copyfile.dest == "build/Makefile"
-        finally:
-            manifest_path.unlink()
+        copyfile = manifest.projects[0].copyfiles[0]
+        assert copyfile.src == "config/Makefile"
+        assert copyfile.dest == "build/Makefile"
 
     def test_parse_project_handles_multiple_copyfile_elements(self):
         """Test that parse_project handles multiple copyfile elements per project."""
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
+        manifest_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
 <manifest>
   <remote name="origin" fetch="https://github.com/" />
   <default remote="origin" revision="main" />
@@ -626,27 +544,18 @@ class TestCopyfileAndLinkfileParsing:
   </project>
 </manifest>
 """
-            )
-            manifest_path = Path(f.name)
 
-        try:
-            manifest = parse_manifest(manifest_path)
+        manifest = parse_manifest(manifest_xml)
 
-            project = manifest.projects[0]
-            assert len(project.copyfiles) == 3
-            assert project.copyfiles[0].src == "docs/README.md"
-            assert project.copyfiles[1].src == "docs/LICENSE"
-            assert project.copyfiles[2].src == "config/Makefile"
-        finally:
-            manifest_path.unlink()
+        project = manifest.projects[0]
+        assert len(project.copyfiles) == 3
+        assert project.copyfiles[0].src == "docs/README.md"
+        assert project.copyfiles[1].src == "docs/LICENSE"
+        assert project.copyfiles[2].src == "config/Makefile"
 
     def test_parse_project_extracts_linkfile_elements(self):
         """Test that parse_project extracts linkfile elements from XML. (T036)"""
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
+        manifest_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
 <manifest>
   <remote name="origin" fetch="https://github.com/" />
   <default remote="origin" revision="main" />
@@ -655,27 +564,18 @@ class TestCopyfileAndLinkfileParsing:
   </project>
 </manifest>
 """
-            )
-            manifest_path = Path(f.name)
 
-        try:
-            manifest = parse_manifest(manifest_path)
+        manifest = parse_manifest(manifest_xml)
 
-            assert len(manifest.projects) == 1
-            project = manifest.projects[0]
-            assert len(project.linkfiles) == 1
-            assert project.linkfiles[0].src == "scripts/build.sh"
-            assert project.linkfiles[0].dest == "build.sh"
-        finally:
-            manifest_path.unlink()
+        assert len(manifest.projects) == 1
+        project = manifest.projects[0]
+        assert len(project.linkfiles) == 1
+        assert project.linkfiles[0].src == "scripts/build.sh"
+        assert project.linkfiles[0].dest == "build.sh"
 
     def test_parse_project_creates_linkfile_objects_with_correct_src_dest(self):
         """Test that parse_project creates Linkfile objects with correct attributes. (T037)"""
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
+        manifest_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
 <manifest>
   <remote name="origin" fetch="https://github.com/" />
   <default remote="origin" revision="main" />
@@ -684,25 +584,16 @@ class TestCopyfileAndLinkfileParsing:
   </project>
 </manifest>
 """
-            )
-            manifest_path = Path(f.name)
 
-        try:
-            manifest = parse_manifest(manifest_path)
+        manifest = parse_manifest(manifest_xml)
 
-            linkfile = manifest.projects[0].linkfiles[0]
-            assert linkfile.src == "docs"
-            assert linkfile.dest == "documentation"
-        finally:
-            manifest_path.unlink()
+        linkfile = manifest.projects[0].linkfiles[0]
+        assert linkfile.src == "docs"
+        assert linkfile.dest == "documentation"
 
     def test_parse_project_handles_multiple_linkfile_elements(self):
         """Test that parse_project handles multiple linkfile elements per project. (T038)"""
-        from subrepo.manifest_parser import parse_manifest
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                """<?xml version="1.0" encoding="UTF-8"?>
+        manifest_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
 <manifest>
   <remote name="origin" fetch="https://github.com/" />
   <default remote="origin" revision="main" />
@@ -713,16 +604,11 @@ class TestCopyfileAndLinkfileParsing:
   </project>
 </manifest>
 """
-            )
-            manifest_path = Path(f.name)
-
-        try:
-            manifest = parse_manifest(manifest_path)
-
-            project = manifest.projects[0]
-            assert len(project.linkfiles) == 3
-            assert project.linkfiles[0].src == "scripts/build.sh"
-            assert project.linkfiles[1].src == "scripts/test.sh"
-            assert project.linkfiles[2].src == "docs"
-        finally:
-            manifest_path.unlink()
+
+        manifest = parse_manifest(manifest_xml)
+
+        project = manifest.projects[0]
+        assert len(project.linkfiles) == 3
+        assert project.linkfiles[0].src == "scripts/build.sh"
+        assert project.linkfiles[1].src == "scripts/test.sh"
+        assert project.linkfiles[2].src == "docs"
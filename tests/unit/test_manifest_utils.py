@@ -6,7 +6,7 @@ specifically the is_commit_sha() function for distinguishing commit SHAs from br
 
 import pytest
 
-from subrepo.manifest_parser import is_commit_sha
+from subrepo.manifest_parser import SHA_PATTERN, is_commit_sha
 
 
 class TestIsCommitSha:
@@ -42,6 +42,23 @@ class TestIsCommitSha:
         sha = "a" * 41  # 41 chars
         assert is_commit_sha(sha) is False
 
+    def test_rejects_sha_with_trailing_newline(self) -> None:
+        """Test that a SHA followed by a newline is not recognized as a SHA."""
+        assert is_commit_sha("a" * 40 + "\n") is False
+
+    @pytest.mark.parametrize("revision", ["a" * 40, "A" * 40, "a" * 40 + "\n", "main", "g" * 40])
+    def test_agrees_with_sha_pattern(self, revision: str) -> None:
+        """Test that SHA_PATTERN accepts exactly the revisions is_commit_sha accepts."""
+        assert (SHA_PATTERN.match(revision) is not None) is is_commit_sha(revision)
+
+    def test_rejects_hex_literal_prefix(self) -> None:
+        """Test that a 0x-prefixed hex string is not recognized as a SHA."""
+        assert is_commit_sha("0x" + "a" * 38) is False
+
+    def test_rejects_non_ascii_characters(self) -> None:
+        """Test that 40 characters including non-ASCII are not recognized as a SHA."""
+        assert is_commit_sha("\u00e9" + "a" * 39) is False
+
     def test_rejects_non_hex_characters(self) -> None:
         """Test that strings with non-hex characters are not recognized as SHAs."""
         # 40 chars but contains 'g'
@@ -1,19 +1,23 @@
 """Unit tests for data model classes."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from subrepo.exceptions import GitCommandError
 from subrepo.models import (
     Copyfile,
-    GitOperationResult,
     Linkfile,
     Manifest,
     Project,
     Remote,
     SubtreeState,
     SubtreeStatus,
+    _check_project_path,
 )
 
+pytestmark = pytest.mark.unit
+
 
 class TestRemote:
     """Tests for Remote dataclass."""
@@ -35,26 +39,30 @@ class TestRemote:
         )
         assert remote.push_url == "git@github.com:"
 
-    def test_remote_validation_empty_name(self):
-        """Test Remote validation fails for empty name."""
-        with pytest.raises(ValueError, match="name cannot be empty"):
-            Remote(name="", fetch="https://github.com/")
-
-    def test_remote_validation_invalid_name(self):
-        """Test Remote validation fails for invalid name characters."""
-        with pytest.raises(ValueError, match="Invalid remote name"):
-            Remote(name="origin@invalid", fetch="https://github.com/")
-
-    def test_remote_validation_empty_fetch(self):
-        """Test Remote validation fails for empty fetch URL."""
-        with pytest.raises(ValueError, match="fetch URL cannot be empty"):
-            Remote(name="origin", fetch="")
-
-    def test_remote_is_frozen(self):
-        """Test that Remote is immutable."""
-        remote = Remote(name="origin", fetch="https://github.com/")
-        with pytest.raises(Exception):  # FrozenInstanceError  # noqa: B017, PT011
-            remote.name = "changed"
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            pytest.param(
+                {"name": "", "fetch": "https://github.com/"},
+                "name cannot be empty",
+                id="empty-name",
+            ),
+            pytest.param(
+                {"name": "origin@invalid", "fetch": "https://github.com/"},
+                "Invalid remote name",
+                id="invalid-name",
+            ),
+            pytest.param(
+                {"name": "origin", "fetch": ""},
+                "fetch URL cannot be empty",
+                id="empty-fetch",
+            ),
+        ],
+    )
+    def test_remote_validation_fails(self, kwargs, match):
+        """Test Remote validation rejects invalid attributes."""
+        with pytest.raises(ValueError, match=match):
+            Remote(**kwargs)
 
 
 class TestProject:
@@ -78,69 +86,65 @@ class TestProject:
         project = Project(name="org/repo", path="lib/repo", remote="origin")
         assert project.revision == "main"
 
-    def test_project_validation_empty_name(self):
-        """Test Project validation fails for empty name."""
-        with pytest.raises(ValueError, match="name cannot be empty"):
-            Project(name="", path="lib/repo", remote="origin")
-
-    def test_project_validation_empty_path(self):
-        """Test Project validation fails for empty path."""
-        with pytest.raises(ValueError, match="path cannot be empty"):
-            Project(name="org/repo", path="", remote="origin")
-
-    def test_project_validation_absolute_path(self):
-        """Test Project validation fails for absolute path."""
-        with pytest.raises(ValueError, match="must be relative"):
-            Project(name="org/repo", path="/abs/path", remote="origin")
-
-    def test_project_validation_trailing_slash(self):
-        """Test Project validation fails for trailing slash."""
-        with pytest.raises(ValueError, match="must be relative"):
-            Project(name="org/repo", path="lib/repo/", remote="origin")
-
-    def test_project_validation_dotdot_in_path(self):
-        """Test Project validation fails for '..' in path."""
-        with pytest.raises(ValueError, match="cannot contain '..' components"):
-            Project(name="org/repo", path="lib/../repo", remote="origin")
-
-    def test_project_validation_empty_remote(self):
-        """Test Project validation fails for empty remote."""
-        with pytest.raises(ValueError, match="remote reference cannot be empty"):
-            Project(name="org/repo", path="lib/repo", remote="")
-
-    def test_project_is_frozen(self):
-        """Test that Project is immutable."""
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
-        with pytest.raises(Exception):  # FrozenInstanceError  # noqa: B017, PT011
-            project.name = "changed"
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            pytest.param({"name": ""}, "name cannot be empty", id="empty-name"),
+            pytest.param({"path": ""}, "path cannot be empty", id="empty-path"),
+            pytest.param({"path": "/abs/path"}, "must be relative", id="absolute-path"),
+            pytest.param({"path": "lib/repo/"}, "must be relative", id="trailing-slash"),
+            pytest.param(
+                {"path": "lib/../repo"}, "cannot contain '..' components", id="dotdot-in-path"
+            ),
+            pytest.param({"remote": ""}, "remote reference cannot be empty", id="empty-remote"),
+        ],
+    )
+    def test_project_validation_fails(self, kwargs, match):
+        """Test Project validation rejects invalid attributes."""
+        with pytest.raises(ValueError, match=match):
+            Project(**{"name": "org/repo", "path": "lib/repo", "remote": "origin", **kwargs})
+
+    def test_project_has_no_instance_dict(self, sample_project):
+        """Test that Project stores its fields in slots."""
+        assert not hasattr(sample_project, "__dict__")
+
+    def test_project_path_validation_is_memoized(self):
+        """Test that a repeated project path is validated only once."""
+        _check_project_path.cache_clear()
+        Project(name="org/a", path="lib/memo", remote="origin")
+        Project(name="org/b", path="lib/memo", remote="origin")
+        info = _check_project_path.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+
+@pytest.mark.parametrize("instance", ["origin_remote", "sample_project"])
+def test_remote_and_project_are_frozen(instance, request):
+    """Test that Remote and Project are immutable."""
+    obj = request.getfixturevalue(instance)
+    with pytest.raises(FrozenInstanceError):
+        obj.name = "changed"
 
 
 class TestManifest:
     """Tests for Manifest dataclass."""
 
-    def test_manifest_creation_with_valid_data(self):
+    def test_manifest_creation_with_valid_data(self, origin_remote, sample_project):
         """Test creating a Manifest with valid data."""
-        remote = Remote(name="origin", fetch="https://github.com/")
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
-
         manifest = Manifest(
-            remotes={"origin": remote},
-            projects=[project],
+            remotes={"origin": origin_remote},
+            projects=[sample_project],
         )
 
         assert len(manifest.remotes) == 1
-        assert manifest.remotes["origin"] == remote
+        assert manifest.remotes["origin"] == origin_remote
         assert len(manifest.projects) == 1
-        assert manifest.projects[0] == project
+        assert manifest.projects[0] == sample_project
 
-    def test_manifest_with_defaults(self):
+    def test_manifest_with_defaults(self, origin_remote, sample_project):
         """Test Manifest with default remote and revision."""
-        remote = Remote(name="origin", fetch="https://github.com/")
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
-
         manifest = Manifest(
-            remotes={"origin": remote},
-            projects=[project],
+            remotes={"origin": origin_remote},
+            projects=[sample_project],
             default_remote="origin",
             default_revision="develop",
         )
@@ -148,210 +152,160 @@ class TestManifest:
         assert manifest.default_remote == "origin"
         assert manifest.default_revision == "develop"
 
-    def test_manifest_validation_no_remotes(self):
-        """Test Manifest validation fails without remotes."""
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
-
-        with pytest.raises(ValueError, match="at least one remote"):
-            Manifest(remotes={}, projects=[project])
-
-    def test_manifest_validation_no_projects(self):
-        """Test Manifest validation fails without projects."""
-        remote = Remote(name="origin", fetch="https://github.com/")
-
-        with pytest.raises(ValueError, match="at least one project"):
-            Manifest(remotes={"origin": remote}, projects=[])
-
-    def test_manifest_validation_invalid_default_remote(self):
-        """Test Manifest validation fails for non-existent default remote."""
-        remote = Remote(name="origin", fetch="https://github.com/")
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
-
-        with pytest.raises(ValueError, match="Default remote.*not found"):
-            Manifest(
-                remotes={"origin": remote},
-                projects=[project],
-                default_remote="invalid",
-            )
-
-    def test_manifest_validation_project_unknown_remote(self):
-        """Test Manifest validation fails for project with unknown remote."""
-        remote = Remote(name="origin", fetch="https://github.com/")
-        project = Project(name="org/repo", path="lib/repo", remote="unknown")
-
-        with pytest.raises(ValueError, match="references unknown remote"):
-            Manifest(remotes={"origin": remote}, projects=[project])
-
-    def test_manifest_validation_duplicate_paths(self):
-        """Test Manifest validation fails for duplicate project paths."""
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            pytest.param({"remotes": {}}, "at least one remote", id="no-remotes"),
+            pytest.param({"projects": []}, "at least one project", id="no-projects"),
+            pytest.param(
+                {"default_remote": "invalid"}, "Default remote.*not found", id="invalid-default"
+            ),
+            pytest.param(
+                {"projects": [Project(name="org/repo", path="lib/repo", remote="unknown")]},
+                "references unknown remote",
+                id="unknown-remote",
+            ),
+            pytest.param(
+                {
+                    "projects": [
+                        Project(name="org/repo1", path="lib/repo", remote="origin"),
+                        Project(name="org/repo2", path="lib/repo", remote="origin"),
+                    ]
+                },
+                "Duplicate project paths",
+                id="duplicate-paths",
+            ),
+        ],
+    )
+    def test_manifest_validation_fails(self, kwargs, match):
+        """Test Manifest validation rejects inconsistent remotes and projects."""
+        valid = {
+            "remotes": {"origin": Remote(name="origin", fetch="https://github.com/")},
+            "projects": [Project(name="org/repo", path="lib/repo", remote="origin")],
+        }
+
+        with pytest.raises(ValueError, match=match):
+            Manifest(**{**valid, **kwargs})
+
+    def test_manifest_validation_reports_each_duplicate_path_once(self):
+        """Test only the repeated paths are listed, each once."""
         remote = Remote(name="origin", fetch="https://github.com/")
-        project1 = Project(name="org/repo1", path="lib/repo", remote="origin")
-        project2 = Project(name="org/repo2", path="lib/repo", remote="origin")
+        projects = [
+            Project(name=f"org/repo{i}", path=path, remote="origin")
+            for i, path in enumerate(["lib/a", "lib/b", "lib/a", "lib/a", "lib/c"])
+        ]
 
-        with pytest.raises(ValueError, match="Duplicate project paths"):
-            Manifest(remotes={"origin": remote}, projects=[project1, project2])
+        with pytest.raises(ValueError, match=r"^Duplicate project paths found: \{'lib/a'\}$"):
+            Manifest(remotes={"origin": remote}, projects=projects)
 
-    def test_manifest_get_project_by_name(self):
+    def test_manifest_get_project_by_name(self, sample_manifest, sample_project):
         """Test getting project by name."""
-        remote = Remote(name="origin", fetch="https://github.com/")
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
-        manifest = Manifest(remotes={"origin": remote}, projects=[project])
+        found = sample_manifest.get_project_by_name("org/repo")
+        assert found is sample_project
 
-        found = manifest.get_project_by_name("org/repo")
-        assert found == project
-
-        not_found = manifest.get_project_by_name("org/other")
+        not_found = sample_manifest.get_project_by_name("org/other")
         assert not_found is None
 
-    def test_manifest_get_project_by_path(self):
+    def test_manifest_get_project_by_path(self, sample_manifest, sample_project):
         """Test getting project by path."""
-        remote = Remote(name="origin", fetch="https://github.com/")
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
-        manifest = Manifest(remotes={"origin": remote}, projects=[project])
-
-        found = manifest.get_project_by_path("lib/repo")
-        assert found == project
+        found = sample_manifest.get_project_by_path("lib/repo")
+        assert found is sample_project
 
-        not_found = manifest.get_project_by_path("lib/other")
+        not_found = sample_manifest.get_project_by_path("lib/other")
         assert not_found is None
 
-    def test_manifest_validate_returns_empty_list_when_valid(self):
+    def test_manifest_validate_returns_empty_list_when_valid(self, sample_manifest):
         """Test validate() returns empty list for valid manifest."""
+        errors = sample_manifest.validate()
+        assert errors == []
+
+    def test_manifest_and_its_parts_have_no_instance_dict(self):
+        """Test that Manifest and the objects it holds store their fields in slots."""
         remote = Remote(name="origin", fetch="https://github.com/")
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
+        project = Project(
+            name="org/repo",
+            path="lib/repo",
+            remote="origin",
+            copyfiles=[Copyfile(src="a", dest="b")],
+            linkfiles=[Linkfile(src="c", dest="d")],
+        )
         manifest = Manifest(remotes={"origin": remote}, projects=[project])
 
-        errors = manifest.validate()
-        assert errors == []
+        for obj in (manifest, remote, project.copyfiles[0], project.linkfiles[0]):
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
 
 
 class TestSubtreeState:
     """Tests for SubtreeState dataclass."""
 
-    def test_subtree_state_creation(self):
+    def test_subtree_state_creation(self, sample_project):
         """Test creating SubtreeState."""
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
-        state = SubtreeState(project=project)
+        state = SubtreeState(project=sample_project)
 
-        assert state.project == project
+        assert state.project == sample_project
         assert state.status == SubtreeStatus.UNINITIALIZED
         assert state.local_commits == 0
         assert state.upstream_commits == 0
         assert not state.has_local_changes
 
-    def test_subtree_state_needs_sync(self):
-        """Test needs_sync() method."""
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
-
-        state_behind = SubtreeState(project=project, status=SubtreeStatus.BEHIND)
-        assert state_behind.needs_sync()
-
-        state_diverged = SubtreeState(project=project, status=SubtreeStatus.DIVERGED)
-        assert state_diverged.needs_sync()
-
-        state_up_to_date = SubtreeState(project=project, status=SubtreeStatus.UP_TO_DATE)
-        assert not state_up_to_date.needs_sync()
-
-    def test_subtree_state_can_push(self):
-        """Test can_push() method."""
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
-
-        state_ahead = SubtreeState(project=project, status=SubtreeStatus.AHEAD)
-        assert state_ahead.can_push()
-
-        state_ahead_dirty = SubtreeState(
-            project=project, status=SubtreeStatus.AHEAD, has_local_changes=True
+    @pytest.mark.parametrize(
+        ("status", "has_local_changes", "needs_sync", "can_push", "is_clean"),
+        [
+            (SubtreeStatus.BEHIND, False, True, False, False),
+            (SubtreeStatus.DIVERGED, False, True, True, False),
+            (SubtreeStatus.AHEAD, False, False, True, False),
+            (SubtreeStatus.AHEAD, True, False, False, False),
+            (SubtreeStatus.UP_TO_DATE, False, False, False, True),
+            (SubtreeStatus.UP_TO_DATE, True, False, False, False),
+        ],
+    )
+    def test_subtree_state_predicates(
+        self, sample_project, status, has_local_changes, needs_sync, can_push, is_clean
+    ):
+        """Test needs_sync(), can_push() and is_clean() for each status."""
+        state = SubtreeState(
+            project=sample_project, status=status, has_local_changes=has_local_changes
         )
-        assert not state_ahead_dirty.can_push()
-
-        state_up_to_date = SubtreeState(project=project, status=SubtreeStatus.UP_TO_DATE)
-        assert not state_up_to_date.can_push()
 
-    def test_subtree_state_is_clean(self):
-        """Test is_clean() method."""
-        project = Project(name="org/repo", path="lib/repo", remote="origin")
-
-        state_clean = SubtreeState(project=project, status=SubtreeStatus.UP_TO_DATE)
-        assert state_clean.is_clean()
-
-        state_dirty = SubtreeState(
-            project=project,
-            status=SubtreeStatus.UP_TO_DATE,
-            has_local_changes=True,
+        assert (state.needs_sync(), state.can_push(), state.is_clean()) == (
+            needs_sync,
+            can_push,
+            is_clean,
         )
-        assert not state_dirty.is_clean()
-
-        state_ahead = SubtreeState(project=project, status=SubtreeStatus.AHEAD)
-        assert not state_ahead.is_clean()
 
 
 class TestGitOperationResult:
     """Tests for GitOperationResult dataclass."""
 
-    def test_git_operation_result_success(self):
+    def test_git_operation_result_success(self, make_git_result):
         """Test successful git operation result."""
-        result = GitOperationResult(
-            success=True,
-            stdout="Success output",
-            stderr="",
-            exit_code=0,
-            duration=1.5,
-            command=["git", "status"],
-        )
+        result = make_git_result(stdout="Success output", duration=1.5)
 
         assert result.success
         assert result.stdout == "Success output"
         assert result.exit_code == 0
 
-    def test_git_operation_result_get_output_on_success(self):
+    def test_git_operation_result_get_output_on_success(self, make_git_result):
         """Test get_output() returns stdout on success."""
-        result = GitOperationResult(
-            success=True,
-            stdout="Success output",
-            stderr="",
-            exit_code=0,
-            duration=1.0,
-            command=["git", "status"],
-        )
+        result = make_git_result(stdout="Success output")
 
         assert result.get_output() == "Success output"
 
-    def test_git_operation_result_get_output_on_failure(self):
+    def test_git_operation_result_get_output_on_failure(self, make_git_result):
         """Test get_output() returns stderr on failure."""
-        result = GitOperationResult(
-            success=False,
-            stdout="",
-            stderr="Error output",
-            exit_code=1,
-            duration=1.0,
-            command=["git", "status"],
-        )
+        result = make_git_result(success=False, stderr="Error output", exit_code=1)
 
         assert result.get_output() == "Error output"
 
-    def test_git_operation_result_raise_for_status_success(self):
+    def test_git_operation_result_raise_for_status_success(self, make_git_result):
         """Test raise_for_status() does nothing on success."""
-        result = GitOperationResult(
-            success=True,
-            stdout="Success",
-            stderr="",
-            exit_code=0,
-            duration=1.0,
-            command=["git", "status"],
-        )
+        result = make_git_result(stdout="Success")
 
         result.raise_for_status()  # Should not raise
 
-    def test_git_operation_result_raise_for_status_failure(self):
+    def test_git_operation_result_raise_for_status_failure(self, make_git_result):
         """Test raise_for_status() raises on failure."""
-        result = GitOperationResult(
-            success=False,
-            stdout="",
-            stderr="fatal: error",
-            exit_code=1,
-            duration=1.0,
-            command=["git", "status"],
-        )
+        result = make_git_result(success=False, stderr="fatal: error", exit_code=1)
 
         with pytest.raises(GitCommandError) as exc_info:
             result.raise_for_status()
@@ -361,6 +315,13 @@ class TestGitOperationResult:
         assert error.exit_code == 1
         assert error.stderr == "fatal: error"
 
+    def test_git_operation_result_is_frozen(self, make_git_result):
+        """Test that GitOperationResult is immutable and has no instance dict."""
+        result = make_git_result()
+        with pytest.raises(FrozenInstanceError):
+            result.success = False
+        assert not hasattr(result, "__dict__")
+
 
 class TestCopyfile:
     """Tests for Copyfile dataclass."""
@@ -404,7 +365,7 @@ class TestCopyfile:
     def test_copyfile_is_frozen(self):
         """Test that Copyfile is immutable."""
         copyfile = Copyfile(src="file.txt", dest="dest.txt")
-        with pytest.raises(Exception):  # FrozenInstanceError  # noqa: B017, PT011
+        with pytest.raises(FrozenInstanceError):
             copyfile.src = "changed.txt"
 
 
@@ -450,7 +411,7 @@ class TestLinkfile:
     def test_linkfile_is_frozen(self):
         """Test that Linkfile is immutable."""
         linkfile = Linkfile(src="file.txt", dest="link.txt")
-        with pytest.raises(Exception):  # FrozenInstanceError  # noqa: B017, PT011
+        with pytest.raises(FrozenInstanceError):
             linkfile.src = "changed.txt"
 
 
@@ -511,9 +472,9 @@ class TestProjectWithCopyfiles:
 class TestManifestValidateDestPaths:
     """Tests for Manifest.validate() with copyfile/linkfile dest path conflicts."""
 
-    def test_manifest_validate_no_duplicate_dests(self):
+    def test_manifest_validate_no_duplicate_dests(self, origin_remote):
         """Test Manifest.validate() succeeds when no duplicate dest paths."""
-        remotes = {"origin": Remote(name="origin", fetch="https://github.com/")}
+        remotes = {"origin": origin_remote}
         projects = [
             Project(
                 name="org/repo1",
@@ -536,9 +497,9 @@ class TestManifestValidateDestPaths:
         errors = manifest.validate()
         assert errors == []
 
-    def test_manifest_validate_duplicate_copyfile_dest(self):
+    def test_manifest_validate_duplicate_copyfile_dest(self, origin_remote):
         """Test Manifest.validate() detects duplicate copyfile dest paths."""
-        remotes = {"origin": Remote(name="origin", fetch="https://github.com/")}
+        remotes = {"origin": origin_remote}
         projects = [
             Project(
                 name="org/repo1",
@@ -564,9 +525,9 @@ class TestManifestValidateDestPaths:
         assert "org/repo1" in errors[0]
         assert "org/repo2" in errors[0]
 
-    def test_manifest_validate_duplicate_linkfile_dest(self):
+    def test_manifest_validate_duplicate_linkfile_dest(self, origin_remote):
         """Test Manifest.validate() detects duplicate linkfile dest paths."""
-        remotes = {"origin": Remote(name="origin", fetch="https://github.com/")}
+        remotes = {"origin": origin_remote}
         projects = [
             Project(
                 name="org/repo1",
@@ -592,9 +553,9 @@ class TestManifestValidateDestPaths:
         assert "org/repo1" in errors[0]
         assert "org/repo2" in errors[0]
 
-    def test_manifest_validate_copyfile_linkfile_dest_conflict(self):
+    def test_manifest_validate_copyfile_linkfile_dest_conflict(self, origin_remote):
         """Test Manifest.validate() detects conflict between copyfile and linkfile dest."""
-        remotes = {"origin": Remote(name="origin", fetch="https://github.com/")}
+        remotes = {"origin": origin_remote}
         projects = [
             Project(
                 name="org/repo1",
@@ -618,9 +579,9 @@ class TestManifestValidateDestPaths:
         assert len(errors) == 1
         assert "Duplicate linkfile destination 'output.txt'" in errors[0]
 
-    def test_manifest_validate_multiple_duplicates(self):
+    def test_manifest_validate_multiple_duplicates(self, origin_remote):
         """Test Manifest.validate() detects multiple duplicate dest paths."""
-        remotes = {"origin": Remote(name="origin", fetch="https://github.com/")}
+        remotes = {"origin": origin_remote}
         projects = [
             Project(
                 name="org/repo1",
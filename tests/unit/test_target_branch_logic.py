@@ -4,94 +4,87 @@ This module tests the determine_target_branch() function that decides
 which branch to push to based on current context.
 """
 
-from unittest.mock import MagicMock, patch
+import dataclasses
 
 import pytest
 
 from subrepo.git_commands import determine_target_branch
-from subrepo.manifest_parser import extract_default_branch_from_project
 from subrepo.models import BranchInfo, Project
 
+pytestmark = pytest.mark.unit
 
-class TestDetermineTargetBranch:
-    """Tests for determine_target_branch() function."""
-
-    def test_uses_current_branch_when_not_default(self) -> None:
-        """Test that current branch is used when not on default."""
-        branch_info = BranchInfo(
-            current_branch="feature-push",
-            is_default_branch=False,
-            default_branch="main",
-            target_branch="feature-push",
-        )
-        project = Project(
-            name="platform/core",
-            path="platform/core",
-            remote="origin",
-            revision="main",
-        )
-
-        result = determine_target_branch(branch_info, project)
-
-        assert result == "feature-push"
-
-    def test_uses_default_branch_when_on_default(self) -> None:
-        """Test that default branch is used when on default."""
-        branch_info = BranchInfo(
-            current_branch="main",
-            is_default_branch=True,
-            default_branch="main",
-            target_branch="main",
-        )
-        project = Project(
-            name="platform/core",
-            path="platform/core",
-            remote="origin",
-            revision="main",
-        )
-
-        result = determine_target_branch(branch_info, project)
+_SHA = "a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0"
 
-        assert result == "main"
 
-    def test_uses_manifest_default_when_available(self) -> None:
-        """Test that manifest default branch is preferred when available."""
-        # Scenario: We're on "develop" which is the manifest's default,
-        # but git's origin/HEAD points to "main"
-        branch_info = BranchInfo(
-            current_branch="develop",
-            is_default_branch=False,  # Not on git's default
-            default_branch="main",  # Git's default from origin/HEAD
-            target_branch="develop",
-        )
-        project = Project(
-            name="platform/core",
-            path="platform/core",
-            remote="origin",
-            revision="develop",  # Manifest default
-        )
+@pytest.fixture(scope="module")
+def base_project() -> Project:
+    """The platform/core project tracking "main"; vary it with dataclasses.replace."""
+    return Project(
+        name="platform/core",
+        path="platform/core",
+        remote="origin",
+        revision="main",
+    )
 
-        result = determine_target_branch(branch_info, project)
 
-        # When on feature branch, use current branch name
-        assert result == "develop"
+class TestDetermineTargetBranch:
+    """Tests for determine_target_branch() function."""
 
-    def test_handles_sha_in_manifest(self) -> None:
-        """Test that SHA in manifest falls back to git default."""
+    @pytest.mark.parametrize(
+        ("current_branch", "is_default", "default_branch", "target", "revision", "expected"),
+        [
+            pytest.param(
+                "feature-push",
+                False,
+                "main",
+                "feature-push",
+                "main",
+                "feature-push",
+                id="current-branch-when-not-default",
+            ),
+            pytest.param(
+                "main", True, "main", "main", "main", "main", id="default-when-on-default"
+            ),
+            # On the manifest's default "develop" while origin/HEAD points to "main":
+            # the current branch name is used.
+            pytest.param(
+                "develop",
+                False,
+                "main",
+                "develop",
+                "develop",
+                "develop",
+                id="manifest-default-when-available",
+            ),
+            # SHA in manifest falls back to the git default.
+            pytest.param(
+                "main",
+                True,
+                "main",
+                "main",
+                _SHA,
+                "main",
+                id="sha-in-manifest",
+            ),
+        ],
+    )
+    def test_determine_target_branch(
+        self,
+        base_project: Project,
+        current_branch: str,
+        is_default: bool,
+        default_branch: str,
+        target: str,
+        revision: str,
+        expected: str,
+    ) -> None:
+        """Test the pushed branch for each current-branch/manifest combination."""
         branch_info = BranchInfo(
-            current_branch="main",
-            is_default_branch=True,
-            default_branch="main",
-            target_branch="main",
+            current_branch=current_branch,
+            is_default_branch=is_default,
+            default_branch=default_branch,
+            target_branch=target,
         )
-        project = Project(
-            name="platform/core",
-            path="platform/core",
-            remote="origin",
-            revision="a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0",  # SHA
-        )
-
-        result = determine_target_branch(branch_info, project)
+        project = dataclasses.replace(base_project, revision=revision)
 
-        # SHA in manifest → use git default
-        assert result == "main"
+        assert determine_target_branch(branch_info, project) == expected
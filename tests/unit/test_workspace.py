@@ -4,14 +4,15 @@ Tests workspace management functions.
 """
 
 import json
-import tempfile
+import os
 from datetime import UTC, datetime
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from subrepo.exceptions import GitOperationError, WorkspaceError
+from subrepo.git_commands import run_git_command
+from subrepo.manifest_parser import is_commit_sha
 from subrepo.models import Manifest, Project, Remote, WorkspaceConfig
 from subrepo.workspace import (
     create_git_repo,
@@ -20,150 +21,160 @@ from subrepo.workspace import (
     save_workspace_config,
 )
 
+pytestmark = pytest.mark.unit
 
-def create_test_manifest() -> Manifest:
-    """Create a simple test manifest for testing."""
-    return Manifest(
-        remotes={"origin": Remote(name="origin", fetch="https://github.com/")},
-        projects=[
-            Project(
-                name="test/repo",
-                path="lib/repo",
-                remote="origin",
-                revision="main",
-            )
-        ],
-        default_remote="origin",
-        default_revision="main",
-    )
+_TEST_MANIFEST = Manifest(
+    remotes={"origin": Remote(name="origin", fetch="https://github.com/")},
+    projects=[
+        Project(
+            name="test/repo",
+            path="lib/repo",
+            remote="origin",
+            revision="main",
+        )
+    ],
+    default_remote="origin",
+    default_revision="main",
+)
 
+_FROZEN_TS = datetime(2025, 10, 18, 10, 0, 0, tzinfo=UTC)
 
-class TestWorkspaceInitialization:
-    """Tests for workspace initialization functions."""
+_CONFIG_JSON = json.dumps(
+    {
+        "manifest_path": "manifest.xml",
+        "manifest_hash": "def456",
+        "initialized_at": "2025-10-18T10:00:00Z",
+        "git_version": "2.43.0",
+        "subrepo_version": "0.1.0",
+    }
+)
 
-    # Enabled test
-    def test_init_workspace_creates_git_repo(self):
-        """Test that init_workspace creates a git repository.
 
-        This test will FAIL until init_workspace is implemented.
-        """
-        from subrepo.workspace import init_workspace
+# Keep the git processes spawned by these tests independent of the developer's
+# config: no global/system files (hooks, signing, templates), no prompts, no
+# optional index locks, and no auto-gc after the initial commit.
+_GIT_ENV = {
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_SYSTEM": os.devnull,
+    "GIT_TERMINAL_PROMPT": "0",
+    "GIT_OPTIONAL_LOCKS": "0",
+    "GIT_CONFIG_COUNT": "2",
+    "GIT_CONFIG_KEY_0": "commit.gpgsign",
+    "GIT_CONFIG_VALUE_0": "false",
+    "GIT_CONFIG_KEY_1": "gc.auto",
+    "GIT_CONFIG_VALUE_1": "0",
+}
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace_path = Path(tmpdir)
-            manifest = create_test_manifest()
 
-            init_workspace(workspace_path, manifest, "test_manifest.xml")
+def create_test_manifest() -> Manifest:
+    """Return the shared test manifest; callers must not mutate it."""
+    return _TEST_MANIFEST
 
-            # Should create .git directory
-            assert (workspace_path / ".git").exists()
 
-    # Enabled test
-    def test_init_workspace_creates_metadata_directory(self):
-        """Test that init_workspace creates .subrepo metadata directory.
+@pytest.fixture(scope="module", autouse=True)
+def hermetic_git_env():
+    """Apply _GIT_ENV for the module, ahead of the fixtures that spawn git."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in _GIT_ENV.items():
+            mp.setenv(name, value)
+        yield
 
-        This test will FAIL until init_workspace is implemented.
-        """
-        from subrepo.workspace import init_workspace
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace_path = Path(tmpdir)
-            manifest = create_test_manifest()
+@pytest.fixture(scope="module")
+def initialized_workspace(tmp_path_factory):
+    """Run init_workspace once per module; tests only inspect the result."""
+    workspace_path = tmp_path_factory.mktemp("ws")
+    init_workspace(workspace_path, create_test_manifest(), "test_manifest.xml")
+    return workspace_path
 
-            init_workspace(workspace_path, manifest, "test_manifest.xml")
 
-            # Should create .subrepo directory
-            assert (workspace_path / ".subrepo").exists()
-            assert (workspace_path / ".subrepo").is_dir()
+@pytest.fixture(scope="module")
+def created_repo(tmp_path_factory):
+    """Run create_git_repo once per module, returning the path and its result."""
+    repo_path = tmp_path_factory.mktemp("repo")
+    return repo_path, create_git_repo(repo_path)
+
+
+class TestWorkspaceInitialization:
+    """Tests for workspace initialization functions."""
+
+    @pytest.mark.parametrize("subpath", [".git", ".subrepo"])
+    def test_init_workspace_creates_git_and_metadata(self, initialized_workspace, subpath):
+        """Test that init_workspace creates the .git repo and .subrepo metadata directories."""
+        assert (initialized_workspace / subpath).is_dir()
 
     # Enabled test
-    def test_init_workspace_in_non_empty_directory_raises_error(self):
+    @patch("subrepo.workspace.create_git_repo")
+    def test_init_workspace_in_non_empty_directory_raises_error(self, mock_create, tmp_path):
         """Test that init_workspace fails in non-empty directory.
 
         This test will FAIL until init_workspace is implemented.
         """
-        from subrepo.exceptions import WorkspaceError
-        from subrepo.workspace import init_workspace
+        workspace_path = tmp_path
+        manifest = create_test_manifest()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace_path = Path(tmpdir)
-            manifest = create_test_manifest()
+        # Create a file to make directory non-empty
+        (workspace_path / "existing.txt").write_text("content")
 
-            # Create a file to make directory non-empty
-            (workspace_path / "existing.txt").write_text("content")
+        with pytest.raises(WorkspaceError):
+            init_workspace(workspace_path, manifest, "test_manifest.xml")
 
-            with pytest.raises(WorkspaceError):
-                init_workspace(workspace_path, manifest, "test_manifest.xml")
+        # The emptiness check must fail before any git repository is created
+        mock_create.assert_not_called()
 
     # Enabled test
-    def test_create_git_repo_initializes_repository(self):
+    def test_create_git_repo_initializes_repository(self, created_repo):
         """Test that create_git_repo initializes a git repository.
 
         This test will FAIL until create_git_repo is implemented.
         """
-        from subrepo.workspace import create_git_repo
+        repo_path, result = created_repo
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-
-            result = create_git_repo(repo_path)
-
-            assert result.success
-            assert (repo_path / ".git").exists()
+        assert result.success
+        assert (repo_path / ".git").exists()
 
     # Enabled test
-    def test_create_git_repo_with_initial_commit(self):
+    def test_create_git_repo_with_initial_commit(self, created_repo):
         """Test that create_git_repo creates an initial commit.
 
         This test will FAIL until create_git_repo is implemented.
         """
-        import subprocess
-
-        from subrepo.workspace import create_git_repo
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-
-            create_git_repo(repo_path)
-
-            # Check for commits
-            result = subprocess.run(
-                ["git", "rev-list", "--count", "HEAD"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-            )
-
-            # Should have at least one commit (initial commit)
-            commit_count = int(result.stdout.strip()) if result.returncode == 0 else 0
-            assert commit_count >= 1, "Should have at least one initial commit"
+        repo_path, _ = created_repo
+
+        # HEAD only resolves to a commit once the initial commit exists; ask git so
+        # packed refs and the reftable format are handled too
+        result = run_git_command(["rev-parse", "--verify", "HEAD^{commit}"], cwd=repo_path)
+        assert is_commit_sha(result.stdout.strip()), "Should have at least one initial commit"
+
+
+@pytest.fixture(scope="module")
+def sample_config():
+    """A WorkspaceConfig with a frozen timestamp, shared read-only by the config tests."""
+    return WorkspaceConfig(
+        manifest_path="https://example.com/manifest.xml",
+        manifest_hash="abc123",
+        initialized_at=_FROZEN_TS,
+        git_version="2.43.0",
+        subrepo_version="0.1.0",
+    )
 
 
 class TestWorkspaceConfiguration:
     """Tests for WorkspaceConfig dataclass and persistence."""
 
     # Enabled test
-    def test_workspace_config_to_json(self):
+    def test_workspace_config_to_json(self, sample_config):
         """Test WorkspaceConfig serialization to JSON.
 
         This test will FAIL until WorkspaceConfig is implemented.
         """
-        import json
-        from datetime import datetime
-
-        from subrepo.models import WorkspaceConfig
-
-        config = WorkspaceConfig(
-            manifest_path="https://example.com/manifest.xml",
-            manifest_hash="abc123",
-            initialized_at=datetime(2025, 10, 18, 10, 0, 0, tzinfo=UTC),
-            git_version="2.43.0",
-            subrepo_version="0.1.0",
-        )
-
-        json_str = config.to_json()
+        json_str = sample_config.to_json()
         parsed = json.loads(json_str)
 
+        # Serialized compactly, without indentation or padding after separators
+        assert "\n" not in json_str
+        assert ", " not in json_str
+
         assert parsed["manifest_path"] == "https://example.com/manifest.xml"
         assert parsed["manifest_hash"] == "abc123"
         assert parsed["git_version"] == "2.43.0"
@@ -175,21 +186,7 @@ class TestWorkspaceConfiguration:
 
         This test will FAIL until WorkspaceConfig is implemented.
         """
-        import json
-
-        from subrepo.models import WorkspaceConfig
-
-        json_str = json.dumps(
-            {
-                "manifest_path": "manifest.xml",
-                "manifest_hash": "def456",
-                "initialized_at": "2025-10-18T10:00:00Z",
-                "git_version": "2.43.0",
-                "subrepo_version": "0.1.0",
-            }
-        )
-
-        config = WorkspaceConfig.from_json(json_str)
+        config = WorkspaceConfig.from_json(_CONFIG_JSON)
 
         assert config.manifest_path == "manifest.xml"
         assert config.manifest_hash == "def456"
@@ -197,34 +194,51 @@ class TestWorkspaceConfiguration:
         assert config.subrepo_version == "0.1.0"
 
     # Enabled test
-    def test_workspace_config_persistence(self):
+    def test_workspace_config_persistence(self, tmp_path, sample_config):
         """Test WorkspaceConfig persistence to .subrepo/config.json.
 
         This test will FAIL until WorkspaceConfig persistence is implemented.
         """
-        from datetime import datetime
+        workspace_path = tmp_path
+        (workspace_path / ".subrepo").mkdir()
+
+        save_workspace_config(workspace_path, sample_config)
+
+        config_path = workspace_path / ".subrepo" / "config.json"
+        assert config_path.stat().st_size > 0
+        assert not config_path.with_suffix(".json.tmp").exists()
+
+        # Load and verify; the frozen timestamp makes the round trip exact
+        loaded_config = load_workspace_config(workspace_path)
+
+        assert loaded_config == sample_config
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_save_workspace_config_honours_umask(self, tmp_path, sample_config):
+        """Test the config file gets the default 0o666 mode masked by the umask."""
+        (tmp_path / ".subrepo").mkdir()
+
+        old_umask = os.umask(0o002)
+        try:
+            save_workspace_config(tmp_path, sample_config)
+        finally:
+            os.umask(old_umask)
 
-        from subrepo.models import WorkspaceConfig
-        from subrepo.workspace import load_workspace_config, save_workspace_config
+        assert (tmp_path / ".subrepo" / "config.json").stat().st_mode & 0o777 == 0o664
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace_path = Path(tmpdir)
-            (workspace_path / ".subrepo").mkdir()
+    def test_load_workspace_config_missing_file_raises_error(self, tmp_path):
+        """Test that loading from a directory without config.json raises WorkspaceError."""
+        with pytest.raises(WorkspaceError) as exc_info:
+            load_workspace_config(tmp_path)
 
-            # Create and save config
-            config = WorkspaceConfig(
-                manifest_path="manifest.xml",
-                manifest_hash="hash123",
-                initialized_at=datetime.now(UTC),
-                git_version="2.43.0",
-                subrepo_version="0.1.0",
-            )
+        assert "Not a subrepo workspace" in str(exc_info.value)
 
-            save_workspace_config(workspace_path, config)
+    def test_load_workspace_config_invalid_file_raises_error(self, tmp_path):
+        """Test that a config.json missing required fields raises WorkspaceError."""
+        (tmp_path / ".subrepo").mkdir()
+        (tmp_path / ".subrepo" / "config.json").write_text('{"manifest_path":"manifest.xml"}')
 
-            # Load and verify
-            loaded_config = load_workspace_config(workspace_path)
+        with pytest.raises(WorkspaceError) as exc_info:
+            load_workspace_config(tmp_path)
 
-            assert loaded_config.manifest_path == config.manifest_path
-            assert loaded_config.manifest_hash == config.manifest_hash
-            assert loaded_config.git_version == config.git_version
+        assert str(exc_info.value) == "Invalid workspace config file: 'manifest_hash'"